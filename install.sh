@@ -302,24 +302,24 @@ install_system_dependencies() {
     case $distro in
         ubuntu|debian)
             sudo apt update
-            sudo apt install -y python3-pip python3-serial python3-psutil python3-tk
+            sudo apt install -y python3-pip python3-serial python3-tk
             ;;
         fedora|rhel|centos)
             if command -v dnf &> /dev/null; then
-                sudo dnf install -y python3-pip python3-pyserial python3-psutil python3-tkinter
+                sudo dnf install -y python3-pip python3-pyserial python3-tkinter
             elif command -v yum &> /dev/null; then
-                sudo yum install -y python3-pip python3-pyserial python3-psutil tkinter
+                sudo yum install -y python3-pip python3-pyserial tkinter
             else
                 print_error "Cannot install dependencies - no package manager found"
                 return 1
             fi
             ;;
         arch|manjaro|cachyos)  # Added cachyos
-            sudo pacman -Sy --noconfirm arduino-cli python-pyserial python-psutil tk
+            sudo pacman -Sy --noconfirm arduino-cli python-pyserial tk
             ;;
         *)
             print_warning "Cannot automatically install dependencies for $distro"
-            print_status "Please install manually: python3, pip, pyserial, psutil, tkinter"
+            print_status "Please install manually: python3, pip, pyserial, tkinter"
             return 1
             ;;
     esac
@@ -332,9 +332,9 @@ install_system_dependencies() {
 install_python_deps() {
     print_status "Installing Python dependencies..."
     if command -v pip3 &> /dev/null; then
-        pip3 install pyserial psutil
+        pip3 install pyserial
     elif command -v pip &> /dev/null; then
-        pip install pyserial psutil
+        pip install pyserial
     else
         print_error "Neither pip nor pip3 found. Please install pip first."
         exit 1
@@ -447,13 +447,13 @@ check_python_deps() {
     print_status "Checking Python dependencies..."
     
     # Check if we can import the required modules
-    if ! python3 -c "import serial, psutil" 2>/dev/null; then
+    if ! python3 -c "import serial" 2>/dev/null; then
         print_warning "Python dependencies missing, attempting to install via system package manager..."
         local distro=$(detect_distro)
         
         if install_system_dependencies "$distro"; then
             # Verify installation
-            if python3 -c "import serial, psutil" 2>/dev/null; then
+            if python3 -c "import serial" 2>/dev/null; then
                 print_success "Python dependencies installed successfully via system package manager"
                 return 0
             fi
@@ -464,7 +464,7 @@ check_python_deps() {
         install_python_deps
         
         # Verify installation
-        if ! python3 -c "import serial, psutil" 2>/dev/null; then
+        if ! python3 -c "import serial" 2>/dev/null; then
             print_error "Failed to install Python dependencies"
             exit 1
         fi
@@ -472,6 +472,19 @@ check_python_deps() {
     print_success "Python dependencies found"
 }
 
+# Function to install optional Python speedups (RFIDisk runs fine without them)
+install_optional_python_deps() {
+    if python3 -c "import orjson" 2>/dev/null; then
+        return 0
+    fi
+    print_status "Installing optional orjson (faster tag database loading)..."
+    if command -v pip3 &> /dev/null && pip3 install orjson &> /dev/null; then
+        print_success "orjson installed"
+    else
+        print_warning "Could not install orjson, falling back to the standard json module"
+    fi
+}
+
 # Function to read the version string from a 'version' file in a given directory
 get_version_from_dir() {
     local dir="$1"
@@ -729,6 +742,7 @@ main_installation() {
     check_arduino_cli
     install_arduino_core  # Install AVR core
     check_python_deps
+    install_optional_python_deps
     check_and_install_tkinter
     
     # Detect hardware
@@ -840,7 +854,7 @@ else
     echo "  • Upload firmware to Arduino"
     echo "  • Install desktop autostart entry (starts automatically on login)"
     echo "  • Install RFIDisk Manager application entry (accessible from app menu)"
-    echo "  • Install Python dependencies (pyserial, psutil)"
+    echo "  • Install Python dependencies (pyserial)"
     echo "  • Install tkinter for GUI tag manager"
     echo "  • Set up serial port permissions"
     echo ""
@@ -1,17 +1,36 @@
 #!/usr/bin/env python3
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
 import json
 import os
 import subprocess
 import sys
+import errno
 import socket
-import psutil
-import time
-import threading
+import struct
 import tempfile
-from PIL import Image, ImageTk
-import webbrowser
+import atexit
+import mmap
+import shlex
+from bisect import bisect_left, insort
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional: much faster JSON parse/serialize for big tag files
+except ImportError:
+    orjson = None
+
+# Tk is only imported by import_ui_modules() once this process knows it is
+# the primary instance, so forwarding --edit to a running manager never pays
+# for loading it (Pillow is only imported by load_logo, for a non-stock logo)
+tk = ttk = messagebox = filedialog = None
+
+
+def import_ui_modules():
+    """Import the GUI toolkit modules into the module namespace"""
+    global tk, ttk, messagebox, filedialog
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog
+
 
 # Directory where this script lives, so the manager works regardless of CWD
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -22,8 +41,28 @@ CONFIG_FILE = os.path.join(SCRIPT_DIR, "rfidisk_config.json")
 THEME_FILE = os.path.join(SCRIPT_DIR, "rfidisk_theme.json")
 VERSION_FILE = os.path.join(SCRIPT_DIR, "version")
 LOGO_FILE = os.path.join(SCRIPT_DIR, "rfidisk.png")
-LOCK_PORT = 47821
+LOCK_PORT = 47821                 # TCP fallback where abstract unix sockets aren't available
+IPC_HEADER = struct.Struct('>I')  # IPC messages are length-prefixed
+IPC_MAX_MESSAGE = 4096
+IPC_READ_TIMEOUT = 0.5            # upper bound on blocking the UI for a slow client
+IPC_CONNECT_TIMEOUT = 0.25        # the kernel completes the connect; no need to wait on the UI
 GITHUB_URL = "https://github.com/ItsDanik/rfidisk"
+SAVE_DEBOUNCE_MS = 250
+SELECT_DEBOUNCE_MS = 30
+TAGS_WRITE_POLL_MS = 50           # how often Tk checks on a background tags write
+DISK_POLL_MS = 1000               # pause between `rfidisk --list` runs
+DISK_QUERY_TIMEOUT_MS = 5000
+BROWSE_FILETYPES = (("Executable files", "*.sh *.py *.desktop"), ("All files", "*.*"))
+SHELL_METACHARACTERS = set('|&;<>*?$`()[]{}~!#\n')
+# Shell builtins and keywords have no executable of their own to exec
+SHELL_BUILTINS = frozenset((
+    '.', ':', 'alias', 'bg', 'break', 'case', 'cd', 'command', 'continue',
+    'declare', 'do', 'done', 'elif', 'else', 'esac', 'eval', 'exec', 'exit',
+    'export', 'fg', 'fi', 'for', 'function', 'getopts', 'hash', 'if', 'jobs',
+    'let', 'local', 'read', 'readonly', 'return', 'select', 'set', 'shift',
+    'source', 'then', 'time', 'times', 'trap', 'type', 'typeset', 'ulimit',
+    'umask', 'unalias', 'unset', 'until', 'wait', 'while',
+))
 
 
 def read_version():
@@ -35,20 +74,85 @@ def read_version():
         return "unknown"
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_json_file(f):
+    """Parse an open binary JSON file, handing orjson a memory map instead of a bytes copy"""
+    if orjson is None or os.fstat(f.fileno()).st_size == 0:
+        return json_loads(f.read())
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def stat_signature(st):
+    """Identify a file version by inode, mtime and size.
+
+    Atomic writes always produce a new inode, so an unchanged signature
+    means the file still holds exactly what we last read or wrote.
+    """
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def file_signature(path):
+    """Return the stat_signature of path, or None if it doesn't exist"""
+    try:
+        return stat_signature(os.stat(path))
+    except FileNotFoundError:
+        return None
+
+
+def read_json_file(path):
+    """Parse a JSON file, returning (signature, data)"""
+    with open(path, 'rb') as f:
+        return stat_signature(os.fstat(f.fileno())), parse_json_file(f)
+
+
+def read_tags_file():
+    """Parse the tags file, returning (signature, tags).
+
+    A missing file yields (None, {}).
+    """
+    try:
+        return read_json_file(TAGS_FILE)
+    except FileNotFoundError:
+        return None, {}
+
+
+def json_dumps(data):
+    """Serialize data as 2-space indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
 def atomic_write_json(path, data):
     """Write JSON to path atomically.
 
     Writes to a temp file in the same directory, fsyncs it, then os.replace()s
     it over the target so a crash mid-write can never corrupt the existing file.
+    Returns the stat_signature of the written file.
     """
+    return atomic_write_bytes(path, json_dumps(data))
+
+
+def atomic_write_bytes(path, payload):
+    """Write already-serialized bytes to path atomically (see atomic_write_json)"""
     dir_name = os.path.dirname(path) or "."
     fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".tmp-", suffix=".json")
     try:
-        with os.fdopen(fd, 'w') as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
+            signature = stat_signature(os.fstat(f.fileno()))
         os.replace(tmp_path, path)
+        return signature
     except Exception:
         try:
             os.remove(tmp_path)
@@ -92,6 +196,56 @@ COLORS = {
     "accent_highlight": "#fab387"
 }
 
+def command_argv(command):
+    """Split a command into an argv list, or return None if it needs a shell.
+
+    Plain (optionally quoted) "program arg arg" commands are exec'd directly,
+    saving the /bin/sh process; anything using expansion, redirection, pipes,
+    a shell builtin or a leading VAR=value assignment still goes through the
+    shell.
+    """
+    if any(c in SHELL_METACHARACTERS for c in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or '=' in argv[0] or argv[0] in SHELL_BUILTINS:
+        return None
+    return argv
+
+def spawn_command(command):
+    """Start a tag's launch/terminate command in its own session"""
+    argv = command_argv(command)
+    if argv is not None:
+        try:
+            return subprocess.Popen(argv, start_new_session=True)
+        except OSError as e:
+            # Scripts without a shebang (ENOEXEC) and names only the shell
+            # knows (ENOENT) still work the way they always did through sh
+            if e.errno not in (errno.ENOEXEC, errno.ENOENT):
+                raise
+    return subprocess.Popen(command, shell=True, start_new_session=True)
+
+def notify_daemon():
+    """Ask a running rfidisk daemon to reload its config now"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        # Abstract socket bound by the daemon (see RELOAD_ADDRESS in rfidisk.py);
+        # with no daemon running the send is refused, it never reaches a stranger
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.sendto(b"RELOAD", f"\0rfidisk-reload-{os.getuid()}")
+        return True
+    except OSError:
+        return False
+
+def get_edit_tag_id():
+    """Return the tag id passed as `--edit <tag_id>`, if any"""
+    if len(sys.argv) > 2 and sys.argv[1] == "--edit":
+        return sys.argv[2]
+    return None
+
 class SingletonApp:
     """Prevent multiple instances and handle inter-process communication"""
     def __init__(self):
@@ -99,34 +253,62 @@ class SingletonApp:
         self.is_primary = False
         self.listening = False
         
+    @staticmethod
+    def _lock_socket():
+        """Create the lock/IPC socket, returning (socket, address).
+
+        On Linux this is a per-user socket in the abstract unix namespace: no
+        TCP stack, no fixed port to collide on, and the kernel drops the name
+        as soon as the primary instance exits.
+        """
+        if sys.platform.startswith('linux'):
+            address = f"\0rfidisk-manager-{os.getuid()}"
+            return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM), address
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        return sock, ('localhost', LOCK_PORT)
+
     def acquire_lock(self):
         """Try to bind to a socket - if successful, we're the first instance"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind(('localhost', LOCK_PORT))
+            self.socket, address = self._lock_socket()
+            if self.socket.family == socket.AF_INET:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.socket.bind(address)
             self.socket.listen(1)
             self.socket.setblocking(False)
             self.is_primary = True
             return True
         except socket.error:
+            if self.socket:
+                self.socket.close()
+                self.socket = None
             return False
     
     def send_to_primary(self, tag_id=None):
         """Send a message to the primary instance"""
         try:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.settimeout(1.0)
-            client_socket.connect(('localhost', LOCK_PORT))
-            if tag_id:
-                client_socket.send(f"EDIT:{tag_id}".encode())
-            else:
-                client_socket.send("FOCUS".encode())
-            client_socket.close()
+            client_socket, address = self._lock_socket()
+            with client_socket:
+                client_socket.settimeout(IPC_CONNECT_TIMEOUT)
+                client_socket.connect(address)
+                payload = (f"EDIT:{tag_id}" if tag_id else "FOCUS").encode()
+                client_socket.sendall(IPC_HEADER.pack(len(payload)) + payload)
             return True
         except socket.error:
             return False
     
+    def forward_to_primary(self, edit_tag_id=None):
+        """Hand this invocation over to the already running primary instance"""
+        if edit_tag_id:
+            print(f"Another instance detected, requesting to edit tag: {edit_tag_id}")
+            if self.send_to_primary(edit_tag_id):
+                print("Request sent to existing instance")
+            else:
+                print("Failed to communicate with existing instance")
+        else:
+            print("Another instance detected, bringing it to focus")
+            self.send_to_primary()
+    
     def check_for_messages(self):
         """Check for incoming messages from other instances"""
         if not self.is_primary or not self.socket or not self.listening:
@@ -134,14 +316,31 @@ class SingletonApp:
             
         try:
             client, addr = self.socket.accept()
-            client.setblocking(True)
-            data = client.recv(1024).decode().strip()
-            client.close()
-            return data
         except BlockingIOError:
             return None
         except socket.error:
             return None
+        
+        with client:
+            client.settimeout(IPC_READ_TIMEOUT)
+            try:
+                (length,) = IPC_HEADER.unpack(self._recv_exact(client, IPC_HEADER.size))
+                if length > IPC_MAX_MESSAGE:
+                    return None
+                return self._recv_exact(client, length).decode().strip()
+            except (socket.error, UnicodeDecodeError):
+                return None
+    
+    @staticmethod
+    def _recv_exact(client, size):
+        """Read exactly size bytes, however the sender's writes were split up"""
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = client.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("connection closed mid-message")
+            buf += chunk
+        return bytes(buf)
     
     def start_listening(self):
         """Start listening for messages"""
@@ -159,36 +358,81 @@ class SingletonApp:
             self.socket = None
 
 class TagManager:
-    def __init__(self, root):
+    # Per-tag fields edited in the editor panel (besides the tag ID itself)
+    TAG_FIELDS = ('command', 'line1', 'line2', 'line3', 'line4', 'terminate')
+    TAG_FIELD_LABELS = ("Launch Command:", "Display Line 1:", "Display Line 2:",
+                        "Display Line 3:", "Display Line 4:", "Terminate Command:")
+
+    def __init__(self, root, singleton=None):
         self.root = root
         self.root.title(f"RFIDisk Tag Manager v{VERSION}")
         self.root.geometry("740x720")
+
+        # File I/O thread: reads the tags file while the UI is being built,
+        # then performs tag writes so a slow disk never stalls the UI
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        tags_future = self._io_pool.submit(read_tags_file)
         
         # Load theme configuration
+        self._style = None
+        self._applied_styles = {}  # (method, style name) -> options last applied
+        self._theme_config = None
+        self._theme_signature = None
         self.themes = {}
         self.current_theme_name = "Catppuccin Mocha"
         self.load_theme_config()
         
         # Singleton management
-        self.singleton = SingletonApp()
+        self.singleton = singleton or SingletonApp()
         self.setup_singleton()
         
-        self.tags = self.load_tags()
+        self.tags = {}
+        self._last_saved_config = None
+        self._config_signature = None
         self.config = self.load_config()
         self.current_tag = None
+        self._draft = {}  # editor field edits not yet saved to self.tags
+        self._select_job = None
         self.display_mode = "line1"
 
+        # Sorted listbox rows, memoized per (display_mode, tags version)
+        self._tags_version = 0
+        self._display_cache = {}
+        self._display_index = {}  # tag_id -> row, for the current cache entry
+        self._sort_keys = {}      # tag_id -> (casefolded line1, line1 label)
+        self._line1_order = None  # sorted [(casefolded line1, tag_id)], None = rebuild
+        self._id_order = None     # sorted [tag_id], None = rebuild
+        self._listbox_rows = ([], [])  # (tag_ids, labels) currently shown in the listbox
+        self._highlight_row = None
+
+        # Tag writes are coalesced: save_tags() only marks them dirty and
+        # _flush_tags() writes the file once the edits settle down
+        self._tags_dirty = False
+        self._flush_job = None
+        self._last_saved_tags = None  # serialized form of the last write
+        self._provisional = set()     # --edit templates not written until saved
+        self._tags_signature = None   # stat_signature of the file self.tags matches
+        self._tags_write = None       # Future of the write running on the I/O thread
+        atexit.register(self._write_tags_at_exit)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
+
         # Live disk monitoring state (populated by the background `rfidisk --list` poller)
         self.inserted_tag_id = None          # tag_id of the currently inserted disk (None if empty)
         self.inserted_blank_tag_id = None    # set when the inserted disk is blank/unassigned
         self._highlight_tag_id = None        # tag_id to visually mark in the list (inserted + registered)
-        self._disk_monitor_stop = threading.Event()
+        self._disk_query = None              # running `rfidisk --list` process, if any
+        self._disk_query_output = bytearray()
+        self._disk_query_timeout = None
+        self._disk_monitor_job = None
+        self._disk_monitor_stopped = False
 
-        # Load logo image
+        # Logo image, loaded by _get_logo() the first time a tab shows it
         self.logo_image = None
-        self.load_logo()
+        self._logo_loaded = False
 
         self.create_widgets()
+        self.tags = self.load_tags(tags_future)
+        self._tags_changed()
         self.refresh_tag_list()
 
         # Start IPC handler after UI is fully set up
@@ -202,8 +446,8 @@ class TagManager:
         global COLORS
         
         try:
-            with open(THEME_FILE, 'r') as f:
-                theme_config = json.load(f)
+            self._theme_signature, theme_config = read_json_file(THEME_FILE)
+            self._theme_config = theme_config
             
             # Load available themes
             self.themes = theme_config.get("themes", {})
@@ -228,12 +472,15 @@ class TagManager:
     def save_theme_config(self, theme_name):
         """Save current theme to configuration file"""
         try:
-            with open(THEME_FILE, 'r') as f:
-                theme_config = json.load(f)
+            # Reuse the parsed theme file unless someone changed it on disk
+            if (self._theme_config is None
+                    or file_signature(THEME_FILE) != self._theme_signature):
+                self._theme_signature, self._theme_config = read_json_file(THEME_FILE)
+            theme_config = self._theme_config
             
             theme_config["current_theme"] = theme_name
 
-            atomic_write_json(THEME_FILE, theme_config)
+            self._theme_signature = atomic_write_json(THEME_FILE, theme_config)
 
             print(f"Theme saved: {theme_name}")
             return True
@@ -269,57 +516,79 @@ class TagManager:
         self.root.configure(bg=COLORS["bg_primary"])
         
         # Update warning labels and other non-ttk widgets
-        for widget in self.root.winfo_children():
-            self._update_widget_colors(widget)
+        self._update_widget_colors(self.root.winfo_children())
     
-    def _update_widget_colors(self, widget):
-        """Recursively update widget colors"""
-        try:
+    def _update_widget_colors(self, widgets):
+        """Update colors of the given widgets and all of their descendants"""
+        # Resolve the palette once for the whole walk rather than per widget
+        bg_set = frozenset((COLORS["bg_primary"], COLORS["bg_secondary"], COLORS["bg_tertiary"]))
+        bg = COLORS["bg_primary"]
+        warn_fg = COLORS.get("text_warning", "#f38ba8")
+        highlight_fg = COLORS.get("accent_highlight", "#fab387")
+        text_fg = COLORS["text_primary"]
+        
+        # Breadth-first walk instead of one Python call frame per widget
+        pending = deque(widgets)
+        while pending:
+            widget = pending.popleft()
             if isinstance(widget, tk.Label):
-                # Update background
-                if widget.cget('bg') in [COLORS["bg_primary"], COLORS["bg_secondary"], COLORS["bg_tertiary"]]:
-                    widget.configure(bg=COLORS["bg_primary"])
-                
-                # Update text colors
-                current_fg = widget.cget('fg')
-                if current_fg == COLORS.get("text_warning", "#f38ba8"):
-                    widget.configure(fg=COLORS["text_warning"])
-                elif current_fg == COLORS.get("accent_highlight", "#fab387"):
-                    widget.configure(fg=COLORS["accent_highlight"])
-                else:
-                    widget.configure(fg=COLORS["text_primary"])
+                try:
+                    if widget.cget('bg') in bg_set:
+                        widget.configure(bg=bg)
                     
-        except tk.TclError:
-            pass
-        
-        # Recursively update child widgets
-        for child in widget.winfo_children():
-            self._update_widget_colors(child)
+                    # Keep warning/highlight text colors, everything else is primary text
+                    current_fg = widget.cget('fg')
+                    if current_fg != warn_fg and current_fg != highlight_fg:
+                        widget.configure(fg=text_fg)
+                except tk.TclError:
+                    pass
+            pending.extend(widget.winfo_children())
     
     def load_logo(self):
         """Load the RFIDisk logo image"""
         logo_path = LOGO_FILE
-        if os.path.exists(logo_path):
-            try:
-                image = Image.open(logo_path)
+        try:
+            # Tk 8.6 decodes PNG itself and the shipped logo is already 400x100
+            logo_image = tk.PhotoImage(file=logo_path)
+            if (logo_image.width(), logo_image.height()) == (400, 100):
+                self.logo_image = logo_image
+                return
+        except tk.TclError:
+            if not os.path.isfile(logo_path):
+                print(f"Logo file not found: {logo_path}")
+                self.logo_image = None
+                return
+        
+        # Only a replaced logo (other size or format) needs Pillow
+        try:
+            from PIL import Image, ImageTk
+            with Image.open(logo_path) as image:
                 if image.size != (400, 100):
                     image = image.resize((400, 100), Image.Resampling.LANCZOS)
                 self.logo_image = ImageTk.PhotoImage(image)
-            except Exception as e:
-                print(f"Failed to load logo: {e}")
-                self.logo_image = None
-        else:
-            print(f"Logo file not found: {logo_path}")
+                # Tk keeps its own copy of the pixels; drop Pillow's right away
+                image.close()
+        except Exception as e:
+            print(f"Failed to load logo: {e}")
             self.logo_image = None
     
+    def _get_logo(self):
+        """Return the shared logo PhotoImage, loading it on first use"""
+        if not self._logo_loaded:
+            self._logo_loaded = True
+            self.load_logo()
+        return self.logo_image
+    
     def open_github(self):
         """Open the GitHub repository in the default web browser"""
+        import webbrowser  # only needed when the logo is clicked
         webbrowser.open(GITHUB_URL)
     
     def create_clickable_logo(self, parent):
         """Create a clickable logo that opens the GitHub repository"""
-        if self.logo_image:
-            logo_label = tk.Label(parent, image=self.logo_image, bg=COLORS["bg_primary"], cursor="hand2")
+        logo_image = self._get_logo()
+        if logo_image:
+            logo_label = tk.Label(parent, image=logo_image, bg=COLORS["bg_primary"], cursor="hand2")
             logo_label.pack(pady=(0, 10))
             
             logo_label.bind("<Button-1>", lambda e: self.open_github())
@@ -344,177 +613,219 @@ class TagManager:
         else:
             return "Not Installed"
     
+    def _style_table(self):
+        """Return the ttk style options for the current COLORS.
+
+        Keys are (Style method, style name) pairs, values the keyword
+        arguments for that call.
+        """
+        # Resolve the palette once instead of a COLORS lookup per option
+        bg_primary = COLORS["bg_primary"]
+        text_primary = COLORS["text_primary"]
+        surface_primary = COLORS["surface_primary"]
+        accent_primary = COLORS["accent_primary"]
+        surface_secondary = COLORS["surface_secondary"]
+        border_primary = COLORS["border_primary"]
+        bg_tertiary = COLORS["bg_tertiary"]
+        surface_tertiary = COLORS["surface_tertiary"]
+        border_secondary = COLORS["border_secondary"]
+        accent_success = COLORS["accent_success"]
+        text_secondary = COLORS["text_secondary"]
+        
+        return {
+            # Base styles
+            ('configure', '.'): dict(
+                background=bg_primary,
+                foreground=text_primary,
+                fieldbackground=surface_primary,
+                selectbackground=accent_primary,
+                selectforeground=bg_primary,
+                insertcolor=text_primary,
+                troughcolor=surface_secondary,
+                bordercolor=border_primary,
+                darkcolor=bg_tertiary,
+                lightcolor=border_primary),
+            
+            # Specific widgets
+            ('configure', 'TFrame'): dict(
+                background=bg_primary,
+                relief='flat',
+                borderwidth=1),
+            
+            ('configure', 'TLabel'): dict(
+                background=bg_primary,
+                foreground=text_primary,
+                font=('Segoe UI', 9),
+                borderwidth=0,
+                relief='flat'),
+            
+            ('configure', 'TButton'): dict(
+                background=surface_primary,
+                foreground=text_primary,
+                borderwidth=1,
+                focuscolor=surface_secondary,
+                relief='raised',
+                bordercolor=border_primary),
+            
+            ('map', 'TButton'): dict(
+                background=[('active', surface_secondary),
+                            ('pressed', surface_tertiary)],
+                relief=[('pressed', 'sunken')],
+                bordercolor=[('active', border_secondary),
+                             ('pressed', border_primary)]),
+            
+            ('configure', 'TEntry'): dict(
+                fieldbackground=surface_primary,
+                foreground=text_primary,
+                borderwidth=1,
+                relief='solid',
+                bordercolor=border_primary,
+                focuscolor=accent_primary),
+            
+            ('configure', 'TCheckbutton'): dict(
+                background=bg_primary,
+                foreground=text_primary,
+                indicatorcolor=surface_primary,
+                bordercolor=border_primary,
+                indicatorrelief='solid'),
+            
+            ('map', 'TCheckbutton'): dict(
+                indicatorcolor=[('selected', accent_success),
+                                ('active', surface_secondary)],
+                bordercolor=[('active', border_secondary),
+                             ('selected', accent_success)]),
+            
+            ('configure', 'TNotebook'): dict(
+                background=bg_primary,
+                borderwidth=1,
+                bordercolor=border_primary),
+            
+            ('configure', 'TNotebook.Tab'): dict(
+                background=surface_primary,
+                foreground=text_secondary,
+                padding=[15, 5],
+                borderwidth=1,
+                relief='raised',
+                bordercolor=border_primary),
+            
+            ('map', 'TNotebook.Tab'): dict(
+                background=[('selected', accent_primary),
+                            ('active', surface_secondary)],
+                foreground=[('selected', bg_primary),
+                            ('active', text_primary)],
+                bordercolor=[('selected', accent_primary),
+                             ('active', border_secondary)]),
+            
+            ('configure', 'TSpinbox'): dict(
+                fieldbackground=surface_primary,
+                foreground=text_primary,
+                background=surface_primary,
+                arrowcolor=text_primary,
+                borderwidth=1,
+                bordercolor=border_primary,
+                relief='solid',
+                focuscolor=accent_primary),
+            
+            # Combobox styling
+            ('configure', 'TCombobox'): dict(
+                fieldbackground=surface_primary,
+                background=surface_primary,
+                foreground=text_primary,
+                borderwidth=1,
+                bordercolor=border_primary,
+                relief='solid',
+                focuscolor=accent_primary),
+            
+            ('map', 'TCombobox'): dict(
+                fieldbackground=[('readonly', surface_primary)],
+                background=[('readonly', surface_primary)],
+                bordercolor=[('focus', accent_primary),
+                             ('active', border_secondary)]),
+            
+            ('configure', 'NoBorder.TFrame'): dict(
+                background=bg_primary,
+                relief='flat',
+                borderwidth=0),
+        }
+    
     def configure_theme(self):
         """Configure theme with current colors"""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure base styles
-        style.configure('.', 
-                       background=COLORS["bg_primary"],
-                       foreground=COLORS["text_primary"],
-                       fieldbackground=COLORS["surface_primary"],
-                       selectbackground=COLORS["accent_primary"],
-                       selectforeground=COLORS["bg_primary"],
-                       insertcolor=COLORS["text_primary"],
-                       troughcolor=COLORS["surface_secondary"],
-                       bordercolor=COLORS["border_primary"],
-                       darkcolor=COLORS["bg_tertiary"],
-                       lightcolor=COLORS["border_primary"])
-        
-        # Configure specific widgets
-        style.configure('TFrame', 
-                       background=COLORS["bg_primary"],
-                       relief='flat',
-                       borderwidth=1)
-        
-        style.configure('TLabel', 
-                       background=COLORS["bg_primary"],
-                       foreground=COLORS["text_primary"],
-                       font=('Segoe UI', 9),
-                       borderwidth=0,
-                       relief='flat')
-        
-        style.configure('TButton', 
-                       background=COLORS["surface_primary"],
-                       foreground=COLORS["text_primary"],
-                       borderwidth=1,
-                       focuscolor=COLORS["surface_secondary"],
-                       relief='raised',
-                       bordercolor=COLORS["border_primary"])
-        
-        style.map('TButton',
-                 background=[('active', COLORS["surface_secondary"]),
-                           ('pressed', COLORS["surface_tertiary"])],
-                 relief=[('pressed', 'sunken')],
-                 bordercolor=[('active', COLORS["border_secondary"]),
-                             ('pressed', COLORS["border_primary"])])
-        
-        style.configure('TEntry', 
-                       fieldbackground=COLORS["surface_primary"],
-                       foreground=COLORS["text_primary"],
-                       borderwidth=1,
-                       relief='solid',
-                       bordercolor=COLORS["border_primary"],
-                       focuscolor=COLORS["accent_primary"])
-        
-        style.configure('TCheckbutton', 
-                       background=COLORS["bg_primary"],
-                       foreground=COLORS["text_primary"],
-                       indicatorcolor=COLORS["surface_primary"],
-                       bordercolor=COLORS["border_primary"],
-                       indicatorrelief='solid')
-        
-        style.map('TCheckbutton',
-                 indicatorcolor=[('selected', COLORS["accent_success"]),
-                               ('active', COLORS["surface_secondary"])],
-                 bordercolor=[('active', COLORS["border_secondary"]),
-                             ('selected', COLORS["accent_success"])])
-        
-        style.configure('TNotebook', 
-                       background=COLORS["bg_primary"],
-                       borderwidth=1,
-                       bordercolor=COLORS["border_primary"])
-        
-        style.configure('TNotebook.Tab', 
-                       background=COLORS["surface_primary"],
-                       foreground=COLORS["text_secondary"],
-                       padding=[15, 5],
-                       borderwidth=1,
-                       relief='raised',
-                       bordercolor=COLORS["border_primary"])
-        
-        style.map('TNotebook.Tab',
-                 background=[('selected', COLORS["accent_primary"]),
-                           ('active', COLORS["surface_secondary"])],
-                 foreground=[('selected', COLORS["bg_primary"]),
-                           ('active', COLORS["text_primary"])],
-                 bordercolor=[('selected', COLORS["accent_primary"]),
-                             ('active', COLORS["border_secondary"])])
-        
-        style.configure('TSpinbox', 
-                       fieldbackground=COLORS["surface_primary"],
-                       foreground=COLORS["text_primary"],
-                       background=COLORS["surface_primary"],
-                       arrowcolor=COLORS["text_primary"],
-                       borderwidth=1,
-                       bordercolor=COLORS["border_primary"],
-                       relief='solid',
-                       focuscolor=COLORS["accent_primary"])
-        
-        # Combobox styling
-        style.configure('TCombobox',
-                       fieldbackground=COLORS["surface_primary"],
-                       background=COLORS["surface_primary"],
-                       foreground=COLORS["text_primary"],
-                       borderwidth=1,
-                       bordercolor=COLORS["border_primary"],
-                       relief='solid',
-                       focuscolor=COLORS["accent_primary"])
-        
-        style.map('TCombobox',
-                 fieldbackground=[('readonly', COLORS["surface_primary"])],
-                 background=[('readonly', COLORS["surface_primary"])],
-                 bordercolor=[('focus', COLORS["accent_primary"]),
-                            ('active', COLORS["border_secondary"])])
-        
-        style.configure('NoBorder.TFrame', 
-                       background=COLORS["bg_primary"],
-                       relief='flat',
-                       borderwidth=0)
+        # One Style object for the app's lifetime; 'clam' only needs
+        # selecting once, re-theming just reconfigures it
+        style = self._style
+        if style is None:
+            style = self._style = ttk.Style()
+            style.theme_use('clam')
+        
+        # Only re-issue the style commands whose options actually changed;
+        # each one is a Tcl round-trip and makes Tk redraw the affected widgets
+        for key, options in self._style_table().items():
+            if self._applied_styles.get(key) != options:
+                method, name = key
+                getattr(style, method)(name, **options)
+                self._applied_styles[key] = options
+        
+        bg_primary = COLORS["bg_primary"]
+        border_primary = COLORS["border_primary"]
+        surface_primary = COLORS["surface_primary"]
+        text_primary = COLORS["text_primary"]
+        accent_primary = COLORS["accent_primary"]
         
         # Configure root window
-        self.root.configure(bg=COLORS["bg_primary"], highlightbackground=COLORS["border_primary"])
+        self.root.configure(bg=bg_primary, highlightbackground=border_primary)
         
         # Configure non-ttk widgets
-        self.root.option_add('*Listbox*Background', COLORS["surface_primary"])
-        self.root.option_add('*Listbox*Foreground', COLORS["text_primary"])
-        self.root.option_add('*Listbox*selectBackground', COLORS["accent_primary"])
-        self.root.option_add('*Listbox*selectForeground', COLORS["bg_primary"])
+        self.root.option_add('*Listbox*Background', surface_primary)
+        self.root.option_add('*Listbox*Foreground', text_primary)
+        self.root.option_add('*Listbox*selectBackground', accent_primary)
+        self.root.option_add('*Listbox*selectForeground', bg_primary)
         self.root.option_add('*Listbox*font', ('Segoe UI', 9))
-        self.root.option_add('*Listbox*highlightBackground', COLORS["border_primary"])
-        self.root.option_add('*Listbox*highlightColor', COLORS["border_primary"])
+        self.root.option_add('*Listbox*highlightBackground', border_primary)
+        self.root.option_add('*Listbox*highlightColor', border_primary)
         self.root.option_add('*Listbox*borderWidth', 1)
         
         self.root.option_add('*BorderWidth', 1)
         self.root.option_add('*highlightThickness', 1)
-        self.root.option_add('*highlightBackground', COLORS["border_primary"])
-        self.root.option_add('*highlightColor', COLORS["border_primary"])
+        self.root.option_add('*highlightBackground', border_primary)
+        self.root.option_add('*highlightColor', border_primary)
     
     def setup_singleton(self):
         """Handle singleton instance logic"""
-        edit_tag_id = None
-        if len(sys.argv) > 2 and sys.argv[1] == "--edit":
-            edit_tag_id = sys.argv[2]
-        
-        if not self.singleton.acquire_lock():
-            if edit_tag_id:
-                print(f"Another instance detected, requesting to edit tag: {edit_tag_id}")
-                if self.singleton.send_to_primary(edit_tag_id):
-                    print("Request sent to existing instance")
-                else:
-                    print("Failed to communicate with existing instance")
-            else:
-                print("Another instance detected, bringing it to focus")
-                self.singleton.send_to_primary()
-            
+        edit_tag_id = get_edit_tag_id()
+        
+        if not self.singleton.is_primary and not self.singleton.acquire_lock():
+            self.singleton.forward_to_primary(edit_tag_id)
             sys.exit(0)
         
         if edit_tag_id:
             self.root.after(500, lambda: self.focus_and_edit_tag(edit_tag_id))
     
     def setup_ipc_handler(self):
-        """Set up periodic check for inter-process communication"""
+        """Set up event-driven handling of inter-process communication"""
         self.singleton.start_listening()
+        if not self.singleton.socket:
+            return
         
-        def check_ipc():
-            if self.singleton.listening:
-                message = self.singleton.check_for_messages()
-                if message:
-                    self.handle_ipc_message(message)
-            self.root.after(100, check_ipc)
-        
-        check_ipc()
+        try:
+            # Let Tk wake us only when another instance actually connects
+            self.root.tk.createfilehandler(self.singleton.socket, tk.READABLE,
+                                           self._on_ipc_ready)
+        except (AttributeError, tk.TclError):
+            # No file handler support (non-Unix Tk): fall back to polling
+            def check_ipc():
+                if self.singleton.listening:
+                    self._on_ipc_ready()
+                self.root.after(100, check_ipc)
+            
+            check_ipc()
+    
+    def _on_ipc_ready(self, *_):
+        """Handle every pending message on the listening socket"""
+        while self.singleton.listening:
+            message = self.singleton.check_for_messages()
+            if not message:
+                break
+            self.handle_ipc_message(message)
     
     def handle_ipc_message(self, message):
         """Handle messages from other instances"""
@@ -530,28 +841,23 @@ class TagManager:
         """Bring window to front and edit specified tag"""
         self.bring_to_front()
         
+        self.notebook.select(0)
+        
         if tag_id not in self.tags:
-            self.tags[tag_id] = {
+            # The daemon normally writes the entry before launching us
+            self.reload_tags()
+        if tag_id not in self.tags:
+            # Otherwise keep a template in memory only, until it is saved
+            self.create_and_select(tag_id, {
                 'command': '',
                 'line1': 'new entry',
                 'line2': 'configure me',
                 'line3': 'edit rfidisk_tags.json',
                 'line4': tag_id,
                 'terminate': ''
-            }
-            self.save_tags()
-            self.refresh_tag_list()
-        
-        self.notebook.select(0)
-        
-        display_items = self.get_display_items()
-        for i, (current_tag_id, _) in enumerate(display_items):
-            if current_tag_id == tag_id:
-                self.tag_listbox.selection_clear(0, tk.END)
-                self.tag_listbox.selection_set(i)
-                self.tag_listbox.see(i)
-                self.load_tag_data(tag_id)
-                break
+            }, provisional=True)
+        else:
+            self._select_tag_in_list(tag_id, load=True)
         
         self.flash_window()
         
@@ -569,18 +875,13 @@ class TagManager:
     def flash_window(self):
         """Flash the window to get user's attention"""
         original_color = self.root.cget('background')
+        flash_color = COLORS["accent_error"]
         
-        def flash(count=0):
-            if count < 6:
-                if count % 2 == 0:
-                    self.root.configure(background=COLORS["accent_error"])
-                else:
-                    self.root.configure(background=original_color)
-                self.root.after(200, lambda: flash(count + 1))
-            else:
-                self.root.configure(background=original_color)
-        
-        flash()
+        # Schedule the whole blink sequence up front (200 ms per step)
+        self.root.configure(background=flash_color)
+        for step in range(1, 7):
+            color = flash_color if step % 2 == 0 and step < 6 else original_color
+            self.root.after(200 * step, self.root.configure, {'background': color})
     
     def create_warning_label(self, parent):
         """Create warning label with current theme colors and no borders"""
@@ -624,16 +925,18 @@ class TagManager:
                                highlightthickness=0)
             label.pack(fill=tk.X)
     
-    def load_tags(self):
-        """Load tags from JSON file"""
-        if os.path.exists(TAGS_FILE):
-            try:
-                with open(TAGS_FILE, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load tags: {e}")
-                return {}
-        return {}
+    def load_tags(self, future=None):
+        """Load tags from JSON file, or collect a background read of it"""
+        try:
+            if future is not None:
+                self._tags_signature, tags = future.result()
+            else:
+                self._tags_signature, tags = read_tags_file()
+            return tags
+        except Exception as e:
+            self._tags_signature = None
+            messagebox.showerror("Error", f"Failed to load tags: {e}")
+            return {}
     
     def load_config(self):
         """Load configuration from JSON file"""
@@ -650,37 +953,192 @@ class TagManager:
             }
         }
         
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    user_config = json.load(f)
-                    if "settings" in user_config:
-                        default_config["settings"].update(user_config["settings"])
-                print(f"Loaded config from {CONFIG_FILE}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load config: {e}")
-        else:
+        try:
+            self._config_signature, user_config = read_json_file(CONFIG_FILE)
+            if "settings" in user_config:
+                default_config["settings"].update(user_config["settings"])
+            print(f"Loaded config from {CONFIG_FILE}")
+        except FileNotFoundError:
             self.save_config(default_config)
             print(f"Created default config file: {CONFIG_FILE}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load config: {e}")
         
         return default_config
     
-    def save_tags(self):
-        """Save tags to JSON file"""
+    def save_tags(self, *tag_ids):
+        """Mark tags as changed and schedule a debounced write to the JSON file.
+
+        Pass the ids of the tags that were touched; with none, everything
+        derived from self.tags is recomputed.
+        """
+        self._tags_changed(*tag_ids)
+        self._tags_dirty = True
+        # Trailing-edge debounce: restart the timer on every change
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush_job = self.root.after(SAVE_DEBOUNCE_MS, self._flush_tags)
+        return True
+
+    def _tags_changed(self, *tag_ids):
+        """Invalidate everything derived from self.tags after a mutation"""
+        if tag_ids and self._line1_order is not None:
+            sort_keys = self._sort_keys
+            if all(sort_keys.get(tag_id) == (self._sort_entry(self.tags[tag_id])
+                                             if tag_id in self.tags else None)
+                   for tag_id in tag_ids):
+                return  # no row was added, removed or relabelled
+            # Re-position just the touched tags in the sorted indexes
+            for tag_id in tag_ids:
+                self._unindex_tag(tag_id)
+            for tag_id in tag_ids:
+                if tag_id in self.tags:
+                    self._index_tag(tag_id)
+        else:
+            self._sort_keys.clear()
+            self._line1_order = None
+            self._id_order = None
+        self._tags_version += 1
+        self._display_cache.clear()
+        self._display_index = {}
+
+    @staticmethod
+    def _sort_entry(tag_data):
+        """Return the (sort key, label) pair for a tag in line1 display mode"""
+        line1 = tag_data.get('line1', 'Unnamed').strip()
+        if not line1:
+            line1 = "Unnamed"
+        return line1.lower(), line1
+
+    def _build_sort_index(self):
+        """Sort all tags from scratch into the line1 and tag-id indexes"""
+        self._sort_keys = {tag_id: self._sort_entry(tag_data)
+                           for tag_id, tag_data in self.tags.items()}
+        self._line1_order = sorted((entry[0], tag_id)
+                                   for tag_id, entry in self._sort_keys.items())
+        self._id_order = sorted(self.tags)
+
+    def _index_tag(self, tag_id):
+        """Insert a tag into the sorted indexes"""
+        if tag_id in self._sort_keys:
+            return
+        entry = self._sort_keys[tag_id] = self._sort_entry(self.tags[tag_id])
+        insort(self._line1_order, (entry[0], tag_id))
+        insort(self._id_order, tag_id)
+
+    def _unindex_tag(self, tag_id):
+        """Remove a tag from the sorted indexes"""
+        entry = self._sort_keys.pop(tag_id, None)
+        if entry is None:
+            return
+        del self._line1_order[bisect_left(self._line1_order, (entry[0], tag_id))]
+        del self._id_order[bisect_left(self._id_order, tag_id)]
+
+    def reload_tags(self):
+        """Re-read the tags file, keeping provisional entries that aren't on disk"""
+        # Flush pending edits first so they aren't clobbered by the reload
+        self._flush_tags(sync=True)
+        if (self._tags_signature is not None
+                and file_signature(TAGS_FILE) == self._tags_signature):
+            return  # nobody touched the file since we last read or wrote it
+        tags = self.load_tags()
+        for tag_id in list(self._provisional):
+            if tag_id in tags:
+                self._provisional.discard(tag_id)
+            elif tag_id in self.tags:
+                tags[tag_id] = self.tags[tag_id]
+        self.tags = tags
+        self._last_saved_tags = None
+        self._tags_changed()
+
+    def _flush_tags(self, sync=False):
+        """Write pending tag changes to the JSON file (no-op if nothing changed).
+
+        The tags are serialized here, but the write itself runs on the I/O
+        thread unless sync is set (exit, reload), which also waits for any
+        write still in flight.
+        """
+        job, self._flush_job = self._flush_job, None
+        if job is not None:
+            self.root.after_cancel(job)
+        if sync:
+            self._finish_tags_write(wait=True)
+        if not self._tags_dirty:
+            return True
         try:
-            atomic_write_json(TAGS_FILE, self.tags)
+            payload = json_dumps(self._tags_to_save())
+            # Skip the write entirely if nothing actually changed on disk
+            if payload != self._last_saved_tags:
+                if sync:
+                    self._tags_signature = atomic_write_bytes(TAGS_FILE, payload)
+                else:
+                    if self._tags_write is None:
+                        self.root.after(TAGS_WRITE_POLL_MS, self._poll_tags_write)
+                    self._tags_write = self._io_pool.submit(atomic_write_bytes, TAGS_FILE, payload)
+                self._last_saved_tags = payload
+            self._tags_dirty = False
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save tags: {e}")
             return False
 
+    def _tags_to_save(self):
+        """Return the tags as they should be written (provisional ones left out)"""
+        if not self._provisional:
+            return self.tags
+        return {tag_id: tag_data for tag_id, tag_data in self.tags.items()
+                if tag_id not in self._provisional}
+
+    def _write_tags_at_exit(self):
+        """Last-chance tags write for exits that bypass quit_app.
+
+        Runs from atexit, after Tk and the I/O thread are gone, so it writes
+        the file directly and only reports errors on the console."""
+        if not self._tags_dirty:
+            return
+        try:
+            payload = json_dumps(self._tags_to_save())
+            if payload != self._last_saved_tags:
+                atomic_write_bytes(TAGS_FILE, payload)
+            self._tags_dirty = False
+        except Exception as e:
+            print(f"Failed to save tags: {e}")
+
+    def _poll_tags_write(self):
+        """Wait (without blocking Tk) for the background tags write to finish"""
+        if self._tags_write is not None and not self._tags_write.done():
+            self.root.after(TAGS_WRITE_POLL_MS, self._poll_tags_write)
+        else:
+            self._finish_tags_write()
+
+    def _finish_tags_write(self, wait=False):
+        """Collect the result of the background tags write, if there is one"""
+        write = self._tags_write
+        if write is None or not (wait or write.done()):
+            return
+        self._tags_write = None
+        try:
+            self._tags_signature = write.result()
+        except Exception as e:
+            # Mark the tags dirty again so the next flush retries the write
+            self._last_saved_tags = None
+            self._tags_dirty = True
+            messagebox.showerror("Error", f"Failed to save tags: {e}")
+
     def save_config(self, config=None):
         """Save configuration to JSON file"""
         if config is None:
             config = self.config
 
         try:
-            atomic_write_json(CONFIG_FILE, config)
+            payload = json_dumps(config)
+            # Don't rewrite the file if the settings didn't actually change
+            if (payload != self._last_saved_config
+                    or file_signature(CONFIG_FILE) != self._config_signature):
+                self._config_signature = atomic_write_bytes(CONFIG_FILE, payload)
+                self._last_saved_config = payload
+                # Let the daemon pick up e.g. new OLED timers without a disk swap
+                notify_daemon()
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save config: {e}")
@@ -704,12 +1162,21 @@ class TagManager:
         self.notebook.add(self.quit_frame, text="About/Quit")
         
         self.setup_tags_tab()
-        self.setup_settings_tab()
-        self.setup_quit_tab()
+        
+        # The other tabs are only built the first time they are selected
+        self._tab_builders = {str(self.settings_frame): self.setup_settings_tab,
+                              str(self.quit_frame): self.setup_quit_tab}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Add version label at bottom right
         self.create_version_label()
     
+    def _on_tab_changed(self, event=None):
+        """Build the newly selected tab if this is its first showing"""
+        build_tab = self._tab_builders.pop(self.notebook.select(), None)
+        if build_tab is not None:
+            build_tab()
+    
     def create_version_label(self):
         """Create version label at bottom right of window"""
         version_frame = ttk.Frame(self.root)
@@ -799,26 +1266,41 @@ class TagManager:
         self.tag_listbox = tk.Listbox(left_frame, width=25, height=20)
         self.tag_listbox.pack(fill=tk.BOTH, expand=True, pady=5)
         self.tag_listbox.bind('<<ListboxSelect>>', self.on_tag_select)
+        self.tag_listbox.bind('<Shift-Delete>', self.delete_tag_unconfirmed)
+
+        # Inline "new tag" entry, shown above the buttons by the New Tag button
+        self.new_tag_var = tk.StringVar()
+        self.new_tag_entry = ttk.Entry(left_frame, textvariable=self.new_tag_var)
+        self.new_tag_entry.bind('<Return>', self.commit_new_tag)
+        self.new_tag_entry.bind('<Escape>', self.hide_new_tag_entry)
         
         button_frame = ttk.Frame(left_frame)
         button_frame.pack(fill=tk.X)
+        self._tag_button_frame = button_frame
         
         ttk.Button(button_frame, text="New Tag", command=self.new_tag).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(button_frame, text="Delete Tag", command=self.delete_tag).pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        # Right panel - tag editor (this will expand to fill remaining space)
-        editor_container = ttk.Frame(content_container)
-        editor_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
+        # Right panel - tag editor (this will expand to fill remaining space).
+        # Its widgets are built after the first paint, or on first use.
+        self._editor_container = ttk.Frame(content_container)
+        self._editor_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._editor_built = False
+        self.root.after_idle(self._build_editor_panel)
+
+    def _build_editor_panel(self):
+        """Build the tag editor widgets (only once)"""
+        if self._editor_built:
+            return
+        self._editor_built = True
+        editor_container = self._editor_container
+
         # Create a frame for the editor content that can have the warning below it
         editor_content = ttk.Frame(editor_container)
         editor_content.pack(fill=tk.BOTH, expand=True)
         
         # Tag ID
-        ttk.Label(editor_content, text="Tag ID:").grid(row=0, column=0, sticky=tk.W, pady=2)
-        self.tag_id_var = tk.StringVar()
-        self.tag_id_entry = ttk.Entry(editor_content, textvariable=self.tag_id_var, width=30)
-        self.tag_id_entry.grid(row=0, column=1, sticky=tk.W+tk.E, pady=2)
+        self.tag_id_var, self.tag_id_entry = self._add_editor_row(editor_content, 0, "Tag ID:")
 
         # "Copy from Disk" appears only while a blank/unassigned disk is inserted
         self.copy_disk_btn = ttk.Button(editor_content, text="Copy from Disk",
@@ -826,38 +1308,21 @@ class TagManager:
         self.copy_disk_btn.grid(row=0, column=2, padx=5)
         self.copy_disk_btn.grid_remove()
         
-        # Command
-        ttk.Label(editor_content, text="Launch Command:").grid(row=1, column=0, sticky=tk.W, pady=2)
-        self.command_var = tk.StringVar()
-        self.command_entry = ttk.Entry(editor_content, textvariable=self.command_var, width=30)
-        self.command_entry.grid(row=1, column=1, sticky=tk.W+tk.E, pady=2)
+        # Command, display lines and terminate command (one row per TAG_FIELDS entry)
+        self._field_vars = {}
+        for row, (field, label) in enumerate(zip(self.TAG_FIELDS, self.TAG_FIELD_LABELS), start=1):
+            var, entry = self._add_editor_row(editor_content, row, label)
+            self._field_vars[field] = var
+            setattr(self, f"{field}_var", var)
+            setattr(self, f"{field}_entry", entry)
         ttk.Button(editor_content, text="Browse", command=self.browse_command).grid(row=1, column=2, padx=5)
         
-        # Display lines
-        ttk.Label(editor_content, text="Display Line 1:").grid(row=2, column=0, sticky=tk.W, pady=2)
-        self.line1_var = tk.StringVar()
-        self.line1_entry = ttk.Entry(editor_content, textvariable=self.line1_var, width=30)
-        self.line1_entry.grid(row=2, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        ttk.Label(editor_content, text="Display Line 2:").grid(row=3, column=0, sticky=tk.W, pady=2)
-        self.line2_var = tk.StringVar()
-        ttk.Entry(editor_content, textvariable=self.line2_var, width=30).grid(row=3, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        ttk.Label(editor_content, text="Display Line 3:").grid(row=4, column=0, sticky=tk.W, pady=2)
-        self.line3_var = tk.StringVar()
-        ttk.Entry(editor_content, textvariable=self.line3_var, width=30).grid(row=4, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        ttk.Label(editor_content, text="Display Line 4:").grid(row=5, column=0, sticky=tk.W, pady=2)
-        self.line4_var = tk.StringVar()
-        ttk.Entry(editor_content, textvariable=self.line4_var, width=30).grid(row=5, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        # Terminate command
-        ttk.Label(editor_content, text="Terminate Command:").grid(row=6, column=0, sticky=tk.W, pady=2)
-        self.terminate_var = tk.StringVar()
-        ttk.Entry(editor_content, textvariable=self.terminate_var, width=30).grid(row=6, column=1, sticky=tk.W+tk.E, pady=2)
-        
         # Save button
         ttk.Button(editor_content, text="Save Changes", command=self.save_current_tag).grid(row=7, column=1, pady=10)
+        self.editor_status_var = tk.StringVar()
+        ttk.Label(editor_content, textvariable=self.editor_status_var,
+                  foreground=COLORS["text_success"]).grid(row=7, column=2, padx=5)
+        self._editor_status_job = None
         
         # Test buttons
         test_frame = ttk.Frame(editor_content)
@@ -866,9 +1331,23 @@ class TagManager:
         ttk.Button(test_frame, text="Test Terminate", command=self.test_terminate).pack(side=tk.LEFT, padx=5)
         
         editor_content.columnconfigure(1, weight=1)
+
+        # Collect field edits in a working copy; they only reach self.tags
+        # (and the file the daemon launches from) when Save is clicked
+        self._loading_fields = False
+        for field, var in self._field_vars.items():
+            var.trace_add('write', lambda *_, f=field: self._on_field_change(f))
         
         # Now add the warning to the editor_container (below the editor content)
         self.create_warning_label(editor_container)
+
+    def _add_editor_row(self, parent, row, label):
+        """Add a "label: [entry]" row to the editor grid, returning (var, entry)"""
+        ttk.Label(parent, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+        var = tk.StringVar()
+        entry = ttk.Entry(parent, textvariable=var, width=30)
+        entry.grid(row=row, column=1, sticky=tk.W+tk.E, pady=2)
+        return var, entry
     
     def setup_settings_tab(self):
         """Setup the configuration settings tab"""
@@ -880,6 +1359,8 @@ class TagManager:
         settings_container = ttk.Frame(main_container)
         settings_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        settings = self.config["settings"]
+        
         # Theme selection (NEW - added at the top)
         ttk.Label(settings_container, text="Theme:").grid(row=0, column=0, sticky=tk.W, pady=5, padx=5)
         self.theme_var = tk.StringVar()
@@ -895,52 +1376,52 @@ class TagManager:
         
         # Serial port setting
         ttk.Label(settings_container, text="Serial Port:").grid(row=1, column=0, sticky=tk.W, pady=5, padx=5)
-        self.serial_port_var = tk.StringVar(value=self.config["settings"].get("serial_port", "/dev/ttyACM0"))
+        self.serial_port_var = tk.StringVar(value=settings.get("serial_port", "/dev/ttyACM0"))
         self.serial_port_entry = ttk.Entry(settings_container, textvariable=self.serial_port_var, width=30)
         self.serial_port_entry.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
         
         # Removal delay
         ttk.Label(settings_container, text="Removal Delay (seconds):").grid(row=2, column=0, sticky=tk.W, pady=5, padx=5)
-        self.removal_delay_var = tk.DoubleVar(value=self.config["settings"].get("removal_delay", 0.0))
+        self.removal_delay_var = tk.DoubleVar(value=settings.get("removal_delay", 0.0))
         self.removal_delay_spinbox = ttk.Spinbox(settings_container, from_=0.0, to=10.0, increment=0.1, 
                                                 textvariable=self.removal_delay_var, width=10)
         self.removal_delay_spinbox.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
         
         # Disable Autolaunch setting
         ttk.Label(settings_container, text="Disable Autolaunch:").grid(row=3, column=0, sticky=tk.W, pady=5, padx=5)
-        self.disable_autolaunch_var = tk.BooleanVar(value=self.config["settings"].get("disable_autolaunch", False))
+        self.disable_autolaunch_var = tk.BooleanVar(value=settings.get("disable_autolaunch", False))
         self.disable_autolaunch_check = ttk.Checkbutton(settings_container, variable=self.disable_autolaunch_var)
         self.disable_autolaunch_check.grid(row=3, column=1, sticky=tk.W, pady=5, padx=5)
         
         # Desktop notifications
         ttk.Label(settings_container, text="Desktop Notifications:").grid(row=4, column=0, sticky=tk.W, pady=5, padx=5)
-        self.notifications_var = tk.BooleanVar(value=self.config["settings"].get("desktop_notifications", True))
+        self.notifications_var = tk.BooleanVar(value=settings.get("desktop_notifications", True))
         self.notifications_check = ttk.Checkbutton(settings_container, variable=self.notifications_var, 
                                                   command=self.toggle_notification_settings)
         self.notifications_check.grid(row=4, column=1, sticky=tk.W, pady=5, padx=5)
         
         # Notification timeout
         ttk.Label(settings_container, text="Notification Timeout (ms):").grid(row=5, column=0, sticky=tk.W, pady=5, padx=5)
-        self.notification_timeout_var = tk.IntVar(value=self.config["settings"].get("notification_timeout", 8000))
+        self.notification_timeout_var = tk.IntVar(value=settings.get("notification_timeout", 8000))
         self.notification_timeout_spinbox = ttk.Spinbox(settings_container, from_=1000, to=30000, increment=1000, 
                                                        textvariable=self.notification_timeout_var, width=10)
         self.notification_timeout_spinbox.grid(row=5, column=1, sticky=tk.W, pady=5, padx=5)
                 
         # Auto launch manager
         ttk.Label(settings_container, text="Auto Launch Manager:").grid(row=6, column=0, sticky=tk.W, pady=5, padx=5)
-        self.auto_launch_var = tk.BooleanVar(value=self.config["settings"].get("auto_launch_manager", True))
+        self.auto_launch_var = tk.BooleanVar(value=settings.get("auto_launch_manager", True))
         ttk.Checkbutton(settings_container, variable=self.auto_launch_var).grid(row=6, column=1, sticky=tk.W, pady=5, padx=5)
 
         # OLED idle dim delay (burn-in protection; 0 = disabled)
         ttk.Label(settings_container, text="OLED Dim Delay (seconds, 0=off):").grid(row=7, column=0, sticky=tk.W, pady=5, padx=5)
-        self.oled_dim_delay_var = tk.IntVar(value=self.config["settings"].get("oled_dim_delay", 60))
+        self.oled_dim_delay_var = tk.IntVar(value=settings.get("oled_dim_delay", 60))
         self.oled_dim_delay_spinbox = ttk.Spinbox(settings_container, from_=0, to=3600, increment=10,
                                                   textvariable=self.oled_dim_delay_var, width=10)
         self.oled_dim_delay_spinbox.grid(row=7, column=1, sticky=tk.W, pady=5, padx=5)
 
         # OLED idle screen-off delay (burn-in protection; 0 = disabled)
         ttk.Label(settings_container, text="OLED Screen-Off Delay (seconds, 0=off):").grid(row=8, column=0, sticky=tk.W, pady=5, padx=5)
-        self.oled_off_delay_var = tk.IntVar(value=self.config["settings"].get("oled_off_delay", 120))
+        self.oled_off_delay_var = tk.IntVar(value=settings.get("oled_off_delay", 120))
         self.oled_off_delay_spinbox = ttk.Spinbox(settings_container, from_=0, to=3600, increment=10,
                                                  textvariable=self.oled_off_delay_var, width=10)
         self.oled_off_delay_spinbox.grid(row=8, column=1, sticky=tk.W, pady=5, padx=5)
@@ -964,14 +1445,15 @@ class TagManager:
         """Save configuration settings and apply theme"""
         try:
             # Update config with current values
-            self.config["settings"]["serial_port"] = self.serial_port_var.get().strip()
-            self.config["settings"]["removal_delay"] = float(self.removal_delay_var.get())
-            self.config["settings"]["disable_autolaunch"] = bool(self.disable_autolaunch_var.get())
-            self.config["settings"]["desktop_notifications"] = bool(self.notifications_var.get())
-            self.config["settings"]["notification_timeout"] = int(self.notification_timeout_var.get())
-            self.config["settings"]["auto_launch_manager"] = bool(self.auto_launch_var.get())
-            self.config["settings"]["oled_dim_delay"] = int(self.oled_dim_delay_var.get())
-            self.config["settings"]["oled_off_delay"] = int(self.oled_off_delay_var.get())
+            settings = self.config["settings"]
+            settings["serial_port"] = self.serial_port_var.get().strip()
+            settings["removal_delay"] = float(self.removal_delay_var.get())
+            settings["disable_autolaunch"] = bool(self.disable_autolaunch_var.get())
+            settings["desktop_notifications"] = bool(self.notifications_var.get())
+            settings["notification_timeout"] = int(self.notification_timeout_var.get())
+            settings["auto_launch_manager"] = bool(self.auto_launch_var.get())
+            settings["oled_dim_delay"] = int(self.oled_dim_delay_var.get())
+            settings["oled_off_delay"] = int(self.oled_off_delay_var.get())
 
             # Save to file
             if self.save_config():
@@ -1021,195 +1503,249 @@ class TagManager:
         self.refresh_tag_list()
     
     def get_display_items(self):
-        """Get items for display in the listbox based on current mode"""
-        items = []
+        """Get the listbox rows for the current mode as (tag_ids, labels).
+
+        The two lists run in parallel; in tag_id mode they are the same list.
+        """
+        key = (self.display_mode, self._tags_version)
+        cached = self._display_cache.get(key)
+        if cached is not None:
+            items, self._display_index = cached
+            return items
+
+        # The sorted indexes are kept up to date incrementally by
+        # _tags_changed(), so no sorting happens here in the common case
+        if self._line1_order is None:
+            self._build_sort_index()
         
         if self.display_mode == "tag_id":
             # Display Tag IDs, sorted alphabetically
-            for tag_id in sorted(self.tags.keys()):
-                items.append((tag_id, tag_id))
+            tag_ids = labels = self._id_order[:]
         else:
-            # Display Line1 names, sorted alphabetically by line1
-            sorted_items = []
-            for tag_id, tag_data in self.tags.items():
-                line1 = tag_data.get('line1', 'Unnamed').strip()
-                if not line1:
-                    line1 = "Unnamed"
-                sorted_items.append((line1.lower(), tag_id, line1))
-            
-            # Sort by line1 (case-insensitive)
-            sorted_items.sort(key=lambda x: x[0])
-            
-            for _, tag_id, line1 in sorted_items:
-                items.append((tag_id, line1))
-        
+            # Display Line1 names, sorted alphabetically by line1 (case-insensitive)
+            sort_keys = self._sort_keys
+            tag_ids = [tag_id for _, tag_id in self._line1_order]
+            labels = [sort_keys[tag_id][1] for tag_id in tag_ids]
+        
+        items = (tag_ids, labels)
+        self._display_index = {tag_id: i for i, tag_id in enumerate(tag_ids)}
+        self._display_cache[key] = (items, self._display_index)
         return items
     
     def refresh_tag_list(self):
-        """Refresh the tag list with current display mode"""
-        self.tag_listbox.delete(0, tk.END)
-        display_items = self.get_display_items()
-
-        for i, (tag_id, display_text) in enumerate(display_items):
-            self.tag_listbox.insert(tk.END, display_text)
-            # Mark the entry of the currently inserted disk so it stands out.
-            # (Tkinter Listbox can't bold individual items, so we recolor it.)
-            if self._highlight_tag_id and tag_id == self._highlight_tag_id:
-                self.tag_listbox.itemconfig(i,
-                                            foreground=COLORS["accent_success"],
-                                            selectforeground=COLORS["accent_success"])
+        """Refresh the tag list with current display mode.
+
+        Only the rows between the unchanged head and tail of the previous
+        contents are replaced, so a single edited tag costs O(1) Tk calls.
+        """
+        display_items = tag_ids, labels = self.get_display_items()
+        # The cache hands back the very same lists while nothing visible changed
+        if display_items is not self._listbox_rows:
+            self._update_listbox_rows(tag_ids, labels)
+            self._listbox_rows = display_items
+
+        # Mark the entry of the currently inserted disk so it stands out.
+        # (Tkinter Listbox can't bold individual items, so we recolor it.)
+        highlight_row = None
+        if self._highlight_tag_id:
+            highlight_row = self._display_index.get(self._highlight_tag_id)
+        old_row = self._highlight_row
+        if (old_row is not None and old_row != highlight_row
+                and old_row < len(tag_ids)):
+            self.tag_listbox.itemconfig(old_row, foreground='', selectforeground='')
+        if highlight_row is not None:
+            self.tag_listbox.itemconfig(highlight_row,
+                                        foreground=COLORS["accent_success"],
+                                        selectforeground=COLORS["accent_success"])
+        self._highlight_row = highlight_row
     
+    def _update_listbox_rows(self, tag_ids, labels):
+        """Replace the listbox rows that differ from the new (tag_ids, labels)"""
+        old_ids, old_labels = self._listbox_rows
+
+        start = 0
+        common = min(len(old_ids), len(tag_ids))
+        while (start < common and old_ids[start] == tag_ids[start]
+               and old_labels[start] == labels[start]):
+            start += 1
+        old_end, new_end = len(old_ids), len(tag_ids)
+        while (old_end > start and new_end > start
+               and old_ids[old_end - 1] == tag_ids[new_end - 1]
+               and old_labels[old_end - 1] == labels[new_end - 1]):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end > start:
+            self.tag_listbox.delete(start, old_end - 1)
+        if new_end > start:
+            # One variadic insert is a single Tcl call instead of one per row
+            self.tag_listbox.insert(start, *labels[start:new_end])
+
     def get_selected_tag_id(self):
         """Get the actual tag ID from the current selection"""
         selection = self.tag_listbox.curselection()
         if selection:
-            display_items = self.get_display_items()
-            if selection[0] < len(display_items):
-                return display_items[selection[0]][0]  # Return the tag_id
+            # Resolve against the rows actually shown
+            tag_ids = self._listbox_rows[0]
+            if selection[0] < len(tag_ids):
+                return tag_ids[selection[0]]
         return None
     
     def on_tag_select(self, event):
         """Handle tag selection in the listbox"""
+        # Coalesce bursts of selection events (arrow-key scrolling) into one load
+        if self._select_job is not None:
+            self.root.after_cancel(self._select_job)
+        self._select_job = self.root.after(SELECT_DEBOUNCE_MS, self._commit_selection)
+    
+    def _commit_selection(self):
+        """Load the selected tag into the editor, unless it's already there"""
+        self._select_job = None
         tag_id = self.get_selected_tag_id()
-        if tag_id:
+        if tag_id and tag_id != self.current_tag:
             self.load_tag_data(tag_id)
     
     def load_tag_data(self, tag_id):
         """Load tag data into the editor fields"""
+        self._build_editor_panel()
         self.current_tag = tag_id
+        self._draft = {}  # unsaved edits of the previous tag are dropped
         tag_data = self.tags[tag_id]
         
-        self.tag_id_var.set(tag_id)
-        self.command_var.set(tag_data.get('command', ''))
-        self.line1_var.set(tag_data.get('line1', ''))
-        self.line2_var.set(tag_data.get('line2', ''))
-        self.line3_var.set(tag_data.get('line3', ''))
-        self.line4_var.set(tag_data.get('line4', ''))
-        self.terminate_var.set(tag_data.get('terminate', ''))
+        self._loading_fields = True
+        try:
+            self.tag_id_var.set(tag_id)
+            for field, var in self._field_vars.items():
+                var.set(tag_data.get(field, ''))
+        finally:
+            self._loading_fields = False
+
+    def _on_field_change(self, field):
+        """Record an edited editor field in the working copy of the current tag"""
+        if not self._loading_fields:
+            self._draft[field] = self._field_vars[field].get()
     
-    def ask_string_themed(self, title, prompt):
-        """Themed replacement for simpledialog.askstring that follows the app theme"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title(title)
-        dialog.configure(bg=COLORS["bg_primary"])
-        dialog.transient(self.root)
-        dialog.resizable(False, False)
-
-        result = {"value": None}
-
-        container = ttk.Frame(dialog, padding=20)
-        container.pack(fill=tk.BOTH, expand=True)
-
-        ttk.Label(container, text=prompt).pack(anchor=tk.W, pady=(0, 8))
-
-        entry_var = tk.StringVar()
-        entry = ttk.Entry(container, textvariable=entry_var, width=32)
-        entry.pack(fill=tk.X, pady=(0, 12))
-        entry.focus_set()
-
-        def on_ok(event=None):
-            result["value"] = entry_var.get()
-            dialog.destroy()
-
-        def on_cancel(event=None):
-            result["value"] = None
-            dialog.destroy()
-
-        button_frame = ttk.Frame(container)
-        button_frame.pack(fill=tk.X)
-        ttk.Button(button_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=(8, 0))
-        ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT)
-
-        dialog.bind("<Return>", on_ok)
-        dialog.bind("<Escape>", on_cancel)
-
-        # Center over the main window
-        dialog.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() - dialog.winfo_width()) // 2
-        y = self.root.winfo_rooty() + (self.root.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
-
-        dialog.grab_set()
-        self.root.wait_window(dialog)
-        return result["value"]
-
     def new_tag(self):
-        """Create a new tag entry"""
-        tag_id = self.ask_string_themed("New Tag", "Enter Tag ID:")
+        """Show the inline entry for the id of a new tag"""
+        self.new_tag_var.set('')
+        self.new_tag_entry.pack(fill=tk.X, pady=(0, 5), before=self._tag_button_frame)
+        self.new_tag_entry.focus_set()
+
+    def hide_new_tag_entry(self, event=None):
+        """Hide the inline new-tag entry without creating anything"""
+        self.new_tag_entry.pack_forget()
+        self.tag_listbox.focus_set()
+
+    def commit_new_tag(self, event=None):
+        """Create a new tag entry from the inline entry's contents"""
+        tag_id = self.new_tag_var.get().strip()
+        self.hide_new_tag_entry()
         if tag_id and tag_id not in self.tags:
-            self.tags[tag_id] = {
+            self.create_and_select(tag_id, {
                 'command': '',
                 'line1': 'New Tag',
                 'line2': 'Configure me',
                 'line3': '',
                 'line4': tag_id,
                 'terminate': ''
-            }
-            self.save_tags()
-            self.refresh_tag_list()
-            
-            # Select the new tag
-            display_items = self.get_display_items()
-            for i, (tid, _) in enumerate(display_items):
-                if tid == tag_id:
-                    self.tag_listbox.selection_set(i)
-                    self.load_tag_data(tag_id)
-                    break
+            })
+
+    def create_and_select(self, tag_id, tag_data, provisional=False):
+        """Add a tag, then refresh the list once and select/load the new row.
+
+        Provisional tags are left out of the tags file until saved explicitly.
+        """
+        self.tags[tag_id] = tag_data
+        if provisional:
+            self._provisional.add(tag_id)
+            self._tags_changed(tag_id)
+        else:
+            self.save_tags(tag_id)
+        self._select_tag_in_list(tag_id, load=True)
     
-    def delete_tag(self):
-        """Delete the currently selected tag"""
+    def delete_tag(self, confirm=True):
+        """Delete the currently selected tag, returning True if it was deleted"""
         tag_id = self.get_selected_tag_id()
         if tag_id:
-            if messagebox.askyesno("Delete Tag", f"Delete tag '{tag_id}'?"):
+            if not confirm or messagebox.askyesno("Delete Tag", f"Delete tag '{tag_id}'?"):
                 del self.tags[tag_id]
-                self.save_tags()
+                self._provisional.discard(tag_id)
+                self.save_tags(tag_id)
                 self.refresh_tag_list()
                 self.clear_editor()
+                return True
+        return False
+    
+    def delete_tag_unconfirmed(self, event=None):
+        """Delete the selected tag without asking (Shift+Delete)"""
+        # Select the next row so several tags can be removed in a row
+        selection = self.tag_listbox.curselection()
+        if selection and self.delete_tag(confirm=False):
+            tag_ids = self._listbox_rows[0]
+            if tag_ids:
+                self._select_tag_in_list(tag_ids[min(selection[0], len(tag_ids) - 1)], load=True)
+        return "break"
     
     def save_current_tag(self):
         """Save changes to the current tag"""
         if self.current_tag:
-            # If tag ID changed, create new entry and delete old
+            old_tag_id = self.current_tag
             new_tag_id = self.tag_id_var.get().strip()
-            if new_tag_id != self.current_tag:
-                if new_tag_id in self.tags and new_tag_id != self.current_tag:
-                    messagebox.showerror("Error", "Tag ID already exists!")
-                    return
-                # Move to new ID
-                self.tags[new_tag_id] = self.tags[self.current_tag]
-                del self.tags[self.current_tag]
+            if new_tag_id != old_tag_id and new_tag_id in self.tags:
+                messagebox.showerror("Error", "Tag ID already exists!")
+                return
+
+            # Update the entry in place, moving it if the ID was changed
+            tag_data = self.tags.get(old_tag_id)
+            changed = (tag_data is None or new_tag_id != old_tag_id
+                       or old_tag_id in self._provisional)
+            edits = self._draft
+            if tag_data is None:
+                tag_data = {}  # removed from the file behind our back
+                edits = {field: var.get() for field, var in self._field_vars.items()}
+            for field, value in edits.items():
+                if tag_data.get(field) != value:
+                    tag_data[field] = value
+                    changed = True
+            self._draft = {}
+            if new_tag_id != old_tag_id:
+                self.tags.pop(old_tag_id, None)
                 self.current_tag = new_tag_id
+            self.tags[new_tag_id] = tag_data
+            self._provisional.discard(old_tag_id)
             
-            # Update data
-            self.tags[self.current_tag] = {
-                'command': self.command_var.get(),
-                'line1': self.line1_var.get(),
-                'line2': self.line2_var.get(),
-                'line3': self.line3_var.get(),
-                'line4': self.line4_var.get(),
-                'terminate': self.terminate_var.get()
-            }
-            
-            self.save_tags()
+            if changed:
+                self.save_tags(old_tag_id, self.current_tag)
+            # A no-op if nothing visible in the list changed
             self.refresh_tag_list()
-            messagebox.showinfo("Success", "Tag saved successfully!")
+            self.show_editor_status("Tag saved ✓")
+
+    def show_editor_status(self, text, duration_ms=2000):
+        """Show a short-lived, non-blocking status message next to Save"""
+        if self._editor_status_job is not None:
+            self.root.after_cancel(self._editor_status_job)
+        self.editor_status_var.set(text)
+        self._editor_status_job = self.root.after(duration_ms, self._clear_editor_status)
+
+    def _clear_editor_status(self):
+        """Remove the status message once it has expired"""
+        self._editor_status_job = None
+        self.editor_status_var.set('')
     
     def clear_editor(self):
         """Clear the editor fields"""
+        self._build_editor_panel()
         self.current_tag = None
+        self._draft = {}
         self.tag_id_var.set('')
-        self.command_var.set('')
-        self.line1_var.set('')
-        self.line2_var.set('')
-        self.line3_var.set('')
-        self.line4_var.set('')
-        self.terminate_var.set('')
+        for var in self._field_vars.values():
+            var.set('')
     
     def browse_command(self):
         """Browse for an executable file"""
         filename = filedialog.askopenfilename(
             title="Select Application",
-            filetypes=[("Executable files", "*.sh *.py *.desktop"), ("All files", "*.*")]
+            filetypes=BROWSE_FILETYPES
         )
         if filename:
             self.command_var.set(filename)
@@ -1219,7 +1755,7 @@ class TagManager:
         command = self.command_var.get()
         if command:
             try:
-                subprocess.Popen(command, shell=True)
+                spawn_command(command)
                 messagebox.showinfo("Test", "Launch command executed!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to execute: {e}")
@@ -1238,33 +1774,76 @@ class TagManager:
     # Live disk monitoring (polls `rfidisk --list` in the background)
     # ------------------------------------------------------------------
     def start_disk_monitor(self):
-        """Start the background thread that watches the inserted disk"""
-        self._disk_monitor_thread = threading.Thread(
-            target=self._disk_monitor_loop, daemon=True)
-        self._disk_monitor_thread.start()
+        """Start polling the inserted disk from the Tk event loop"""
+        self._query_disk_status()
 
-    def _disk_monitor_loop(self):
-        """Poll `rfidisk --list` once a second and push results to the UI thread"""
+    def _query_disk_status(self):
+        """Start an `rfidisk --list` run; its output arrives via the event loop"""
+        self._disk_monitor_job = None
+        if self._disk_monitor_stopped:
+            return
         rfidisk_script = os.path.join(SCRIPT_DIR, "rfidisk.py")
-        while not self._disk_monitor_stop.is_set():
-            info = self._query_disk_status(rfidisk_script)
-            try:
-                # Widgets may only be touched from the main thread
-                self.root.after(0, self.apply_disk_status, info)
-            except RuntimeError:
-                break  # interpreter/UI is shutting down
-            self._disk_monitor_stop.wait(1.0)
-
-    def _query_disk_status(self, rfidisk_script):
-        """Run `rfidisk --list` and parse its output"""
         try:
-            result = subprocess.run(
-                [sys.executable, rfidisk_script, "--list"],
-                capture_output=True, text=True, timeout=5)
-            return self._parse_list_output(result.stdout)
-        except Exception:
-            return {'present': False, 'tag_id': '',
-                    'line1': '', 'line2': '', 'line3': '', 'line4': ''}
+            proc = subprocess.Popen([sys.executable, rfidisk_script, "--list"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            self.apply_disk_status(self._parse_list_output(''))
+            self._disk_monitor_job = self.root.after(DISK_POLL_MS, self._query_disk_status)
+            return
+
+        self._disk_query = proc
+        self._disk_query_output.clear()
+        self._disk_query_timeout = self.root.after(DISK_QUERY_TIMEOUT_MS, proc.kill)
+        try:
+            self.root.tk.createfilehandler(proc.stdout, tk.READABLE,
+                                           self._on_disk_query_output)
+        except (AttributeError, tk.TclError):
+            # No file handler support (non-Unix Tk): poll for the exit instead
+            self._wait_for_disk_query()
+
+    def _on_disk_query_output(self, *_):
+        """Collect `rfidisk --list` output as it becomes readable"""
+        chunk = os.read(self._disk_query.stdout.fileno(), 65536)
+        if chunk:
+            self._disk_query_output += chunk
+            return
+        self.root.tk.deletefilehandler(self._disk_query.stdout)
+        self._finish_disk_query()
+
+    def _wait_for_disk_query(self):
+        """Fallback for _on_disk_query_output: read the output once it has exited"""
+        if self._disk_query.poll() is None:
+            self._disk_monitor_job = self.root.after(50, self._wait_for_disk_query)
+            return
+        self._disk_query_output += self._disk_query.stdout.read()
+        self._finish_disk_query()
+
+    def _finish_disk_query(self):
+        """Reap the finished query, show its result and schedule the next one"""
+        proc, self._disk_query = self._disk_query, None
+        self.root.after_cancel(self._disk_query_timeout)
+        proc.stdout.close()
+        # A query killed by the timeout counts as "no disk", as before
+        text = self._disk_query_output.decode(errors='replace') if proc.wait() >= 0 else ''
+        self.apply_disk_status(self._parse_list_output(text))
+        self._disk_monitor_job = self.root.after(DISK_POLL_MS, self._query_disk_status)
+
+    def stop_disk_monitor(self):
+        """Stop polling and kill any query still running"""
+        self._disk_monitor_stopped = True
+        if self._disk_monitor_job is not None:
+            self.root.after_cancel(self._disk_monitor_job)
+            self._disk_monitor_job = None
+        proc, self._disk_query = self._disk_query, None
+        if proc is not None:
+            try:
+                self.root.tk.deletefilehandler(proc.stdout)
+            except (AttributeError, tk.TclError):
+                pass
+            self.root.after_cancel(self._disk_query_timeout)
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
 
     def _parse_list_output(self, text):
         """Parse the textual output of `rfidisk --list` into a dict"""
@@ -1333,7 +1912,7 @@ class TagManager:
         self.inserted_tag_id = new_inserted
 
         # Reload tags so daemon-created "new entry" rows are visible
-        self.tags = self.load_tags()
+        self.reload_tags()
 
         # Classify the inserted disk: blank/unassigned vs. registered
         self.inserted_blank_tag_id = None
@@ -1345,6 +1924,7 @@ class TagManager:
                 registered = True
 
         # Show/hide the "Copy from Disk" button
+        self._build_editor_panel()
         if self.inserted_blank_tag_id:
             self.copy_disk_btn.grid()
         else:
@@ -1362,14 +1942,14 @@ class TagManager:
 
     def _select_tag_in_list(self, tag_id, load=False):
         """Select (and optionally load) the given tag in the listbox"""
-        for i, (tid, _) in enumerate(self.get_display_items()):
-            if tid == tag_id:
-                self.tag_listbox.selection_clear(0, tk.END)
-                self.tag_listbox.selection_set(i)
-                self.tag_listbox.see(i)
-                if load:
-                    self.load_tag_data(tag_id)
-                break
+        self.refresh_tag_list()
+        i = self._display_index.get(tag_id)
+        if i is not None:
+            self.tag_listbox.selection_clear(0, tk.END)
+            self.tag_listbox.selection_set(i)
+            self.tag_listbox.see(i)
+            if load:
+                self.load_tag_data(tag_id)
 
     def copy_tag_from_disk(self):
         """Copy the inserted blank disk's tag_id into the Tag ID field"""
@@ -1378,13 +1958,27 @@ class TagManager:
 
     def quit_app(self):
         """Quit the application"""
-        self._disk_monitor_stop.set()
+        # Final write while Tk is still up to report a failure
+        self._flush_tags(sync=True)
+        self.stop_disk_monitor()
+        if self.singleton.socket:
+            try:
+                self.root.tk.deletefilehandler(self.singleton.socket)
+            except (AttributeError, tk.TclError):
+                pass
         self.singleton.cleanup()
-        self.root.quit()
+        self.root.destroy()
 
 def main():
+    # Hand off to a running manager before paying for Tk and UI startup
+    singleton = SingletonApp()
+    if not singleton.acquire_lock():
+        singleton.forward_to_primary(get_edit_tag_id())
+        sys.exit(0)
+
+    import_ui_modules()
     root = tk.Tk()
-    app = TagManager(root)
+    app = TagManager(root, singleton)
     
     # Start on tags tab by default
     if len(sys.argv) == 1 and app.singleton.is_primary:
@@ -1,16 +1,38 @@
 #!/usr/bin/env python3
-import serial
 import time
 import subprocess
 import sys
+import errno
 import json
+import logging
 import os
 import platform
 import signal
-import argparse
+import socket
+import shlex
 import copy
+import functools
+import shutil
 import tempfile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyserial is only imported by import_serial() when the daemon starts, so the
+# --list/--list-title/--load CLI modes polled by status bars never load it
+serial = None
+
+
+def import_serial():
+    """Import pyserial into the module namespace"""
+    global serial
+    import serial
+
+
+logger = logging.getLogger("rfidisk")
+
 # Get the directory where the script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -18,8 +40,35 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(SCRIPT_DIR, "rfidisk_config.json")
 TAGS_FILE = os.path.join(SCRIPT_DIR, "rfidisk_tags.json")
 VERSION_FILE = os.path.join(SCRIPT_DIR, "version")
+NOTIFY_ICON = os.path.join(SCRIPT_DIR, "floppy.png")
+MANAGER_SCRIPT = os.path.join(SCRIPT_DIR, "rfidisk-manager.py")
 SHARED_FILE = "/dev/shm/rfidisk"
 LOAD_FILE = "/dev/shm/rfidisk-load"
+# The manager pings this abstract unix socket to ask for a config reload; the
+# kernel drops the name as soon as the daemon exits, so nothing stale is left
+RELOAD_ADDRESS = f"\0rfidisk-reload-{os.getuid()}"
+
+# Serial reads block for up to this long, so the main loop wakes as soon as a
+# line arrives but still gets to run its periodic checks while idle
+SERIAL_READ_TIMEOUT = 0.5
+LOAD_CHECK_INTERVAL = 1.0     # seconds between checks for a --load trigger
+PROCESS_CHECK_INTERVAL = 2.0  # seconds between checks that the launched app is alive
+TERMINATE_GRACE = 2.0         # seconds between SIGTERM and SIGKILL for a closed app
+RECONNECT_DELAY = 2.0         # seconds between a serial failure and the reconnect attempt
+# Opening the port resets the Arduino; it prints "OK" once it has booted
+ARDUINO_READY_TIMEOUT = 5.5
+
+# Characters that mean a command has to be run through /bin/sh
+SHELL_METACHARACTERS = set('|&;<>*?$`()[]{}~!#\n')
+# Shell builtins and keywords have no executable of their own to exec
+SHELL_BUILTINS = frozenset((
+    '.', ':', 'alias', 'bg', 'break', 'case', 'cd', 'command', 'continue',
+    'declare', 'do', 'done', 'elif', 'else', 'esac', 'eval', 'exec', 'exit',
+    'export', 'fg', 'fi', 'for', 'function', 'getopts', 'hash', 'if', 'jobs',
+    'let', 'local', 'read', 'readonly', 'return', 'select', 'set', 'shift',
+    'source', 'then', 'time', 'times', 'trap', 'type', 'typeset', 'ulimit',
+    'umask', 'unalias', 'unset', 'until', 'wait', 'while',
+))
 
 
 def read_version():
@@ -34,6 +83,52 @@ def read_version():
 # Version number (single source of truth: the 'version' file)
 VERSION = read_version()
 
+def json_load(f):
+    """Parse an open binary JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+
+def json_dumps(data):
+    """Serialize data as 2-space indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def command_argv(command):
+    """Split a command into an argv list, or return None if it needs a shell.
+
+    Plain (optionally quoted) "program arg arg" commands are exec'd directly,
+    saving the /bin/sh process; anything using expansion, redirection, pipes,
+    a shell builtin or a leading VAR=value assignment still goes through the
+    shell.
+    """
+    if any(c in SHELL_METACHARACTERS for c in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or '=' in argv[0] or argv[0] in SHELL_BUILTINS:
+        return None
+    return argv
+
+def spawn_command(command):
+    """Start a tag's launch/terminate command in its own session"""
+    argv = command_argv(command)
+    if argv is not None:
+        try:
+            return subprocess.Popen(argv, start_new_session=True)
+        except OSError as e:
+            # Scripts without a shebang (ENOEXEC) and names only the shell
+            # knows (ENOENT) still work the way they always did through sh
+            if e.errno not in (errno.ENOEXEC, errno.ENOENT):
+                raise
+    return subprocess.Popen(command, shell=True, start_new_session=True)
+
+
 # Default configuration
 default_config = {
     "settings": {
@@ -68,38 +163,62 @@ def load_config():
     # Load settings
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                user_config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                user_config = json_load(f)
                 # Merge settings while preserving structure
                 if "settings" in user_config:
                     config["settings"].update(user_config["settings"])
         except Exception as e:
-            print(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
     else:
         # Create default config file
         save_config(config)
-        print(f"Created default config file: {CONFIG_FILE}")
+        logger.info("Created default config file: %s", CONFIG_FILE)
     
     # Load tags
     if os.path.exists(TAGS_FILE):
         try:
-            with open(TAGS_FILE, 'r') as f:
-                tags = json.load(f)
+            with open(TAGS_FILE, 'rb') as f:
+                tags = json_load(f)
                 # Ensure all entries have the terminate field
                 for tag_id, tag_config in tags.items():
                     if "terminate" not in tag_config:
                         tag_config["terminate"] = ""
         except Exception as e:
-            print(f"Error loading tags: {e}")
+            logger.error("Error loading tags: %s", e)
     else:
         # Create default tags file with example entry
         save_tags(tags)
-        print(f"Created default tags file: {TAGS_FILE}")
+        logger.info("Created default tags file: %s", TAGS_FILE)
     
     return config, tags
 
+def file_signature(path):
+    """Return (inode, mtime_ns, size) for path, or None if it can't be stat'ed"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def config_signature():
+    """Return the combined signature of the config and tags files"""
+    return (file_signature(CONFIG_FILE), file_signature(TAGS_FILE))
+
+def write_shared_file(fd, text):
+    """Replace the whole content of an open shared RAM file in place"""
+    payload = text.encode()
+    # Truncate first, like open('w') did: a reader polling in between sees an
+    # empty file, never the new text with the tail of a longer old one
+    os.ftruncate(fd, 0)
+    os.pwrite(fd, payload, 0)
+
 def atomic_write_json(path, data):
-    """Write JSON to path atomically.
+    """Write JSON to path atomically (see atomic_write_bytes)"""
+    atomic_write_bytes(path, json_dumps(data))
+
+def atomic_write_bytes(path, payload):
+    """Write already-serialized bytes to path atomically.
 
     Writes to a temp file in the same directory, fsyncs it, then os.replace()s
     it over the target so a crash mid-write can never corrupt the existing file.
@@ -107,8 +226,8 @@ def atomic_write_json(path, data):
     dir_name = os.path.dirname(path) or "."
     fd, tmp_path = tempfile.mkstemp(dir=dir_name, prefix=".tmp-", suffix=".json")
     try:
-        with os.fdopen(fd, 'w') as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, path)
@@ -125,7 +244,7 @@ def save_config(config):
         atomic_write_json(CONFIG_FILE, config)
         return True
     except Exception as e:
-        print(f"Error saving config: {e}")
+        logger.error("Error saving config: %s", e)
         return False
 
 def save_tags(tags):
@@ -134,147 +253,197 @@ def save_tags(tags):
         atomic_write_json(TAGS_FILE, tags)
         return True
     except Exception as e:
-        print(f"Error saving tags: {e}")
+        logger.error("Error saving tags: %s", e)
         return False
 
+# Pipes separate fields in the serial protocol, so they're escaped in text
+PIPE_ESCAPE = str.maketrans('|', '_')
+
+@functools.lru_cache(maxsize=64)
+def display_command(line1, line2, line3, line4, icon_type):
+    """Build the encoded D|line1|line2|line3|line4|iconType serial command.
+
+    Lines are truncated to fit the OLED and have pipes escaped. Cached, since
+    the same few tag screens and the Ready screen are sent over and over."""
+    command = "D|%s|%s|%s|%s|%s\n" % (
+        line1[:20].translate(PIPE_ESCAPE),
+        line2[:20].translate(PIPE_ESCAPE),
+        line3[:14].translate(PIPE_ESCAPE),
+        line4[:14].translate(PIPE_ESCAPE),
+        icon_type,
+    )
+    return command.encode()
+
 class RFIDLauncher:
     def __init__(self):
+        import_serial()
         self.config, self.tags = load_config()
+        self._config_signature = config_signature()
+        self._saved_tags = None  # Serialized tags as last written by the daemon
+        self._apply_settings()
+        self._index_tags()
         self.serial_conn = None
+        self._rx_accum = bytearray()  # Partial line carried over between reads
         self.active_tag = None
         self.active_process = None
+        self.pending_kill = None  # (process, pgid, deadline) awaiting SIGKILL escalation
+        self.pending_removal = None  # (tag_id, deadline) for a disk lifted off the reader
+        self.reload_socket = None  # Bound in run(); the manager pings it on save
+        self.event_handlers = {"ON:": self.on_tag_inserted, "OF:": self.on_tag_removed}
         self.running = True
         self.last_unknown_tag = None
         self.serial_error_count = 0
         self.max_serial_errors = 5
         self.reconnecting = False
+        self.reconnect_at = None  # monotonic time of the scheduled reconnect attempt
         self.last_display_state = ("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}")
+        self.last_display_frame = None  # Last frame sent on the current connection
+        # Shared RAM files stay open so updates don't re-open them every time
+        self.shared_fd = None
+        self.load_fd = None
+        self.load_seen = None  # (mtime_ns, size) of the load file when last read
         
         # State tracking in RAM only
         self.app_was_launched_by_us = False
         self.recovery_mode = False  # Prevent notifications during recovery
         self.pending_load_command = None  # Track command waiting for load
 
+        # Resolve notify-send once instead of probing with `which` per notification
+        self.notify_send = shutil.which("notify-send")
+
     def create_shared_files(self):
         """Create the shared RAM files upon initialization"""
         try:
+            self.close_shared_files()
+            flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC
+            
             # Write initial ready state to shared file
-            content = f"Ready|Insert Disk||RFIDisk v{VERSION}"
-            with open(SHARED_FILE, 'w') as f:
-                f.write(content)
-            print(f"Created shared display file: {SHARED_FILE}")
+            self.shared_fd = os.open(SHARED_FILE, flags, 0o666)
+            write_shared_file(self.shared_fd, f"Ready|Insert Disk||RFIDisk v{VERSION}")
+            logger.debug("Created shared display file: %s", SHARED_FILE)
             
             # Create empty load command file
-            with open(LOAD_FILE, 'w') as f:
-                f.write("")
-            print(f"Created shared load file: {LOAD_FILE}")
+            self.load_fd = os.open(LOAD_FILE, flags, 0o666)
+            logger.debug("Created shared load file: %s", LOAD_FILE)
             
             return True
         except Exception as e:
-            print(f"Error creating shared files: {e}")
+            logger.error("Error creating shared files: %s", e)
             return False
 
     def update_shared_file(self, line1, line2, line3="", line4=""):
         """Update the shared display file with current display info"""
         try:
+            if self.shared_fd is None:
+                return False
             # Format: line1|line2|line3|line4
-            content = f"{line1}|{line2}|{line3}|{line4}"
-            with open(SHARED_FILE, 'w') as f:
-                f.write(content)
+            write_shared_file(self.shared_fd, f"{line1}|{line2}|{line3}|{line4}")
             return True
         except Exception as e:
-            print(f"Error updating shared file: {e}")
+            logger.error("Error updating shared file: %s", e)
             return False
 
     def write_load_command(self, command):
         """Write the launch command to the load file"""
         try:
-            with open(LOAD_FILE, 'w') as f:
-                f.write(command)
+            if self.load_fd is None:
+                return False
+            write_shared_file(self.load_fd, command)
             self.pending_load_command = command
-            print(f"Written load command: {command}")
+            logger.debug("Written load command: %s", command)
             return True
         except Exception as e:
-            print(f"Error writing load command: {e}")
+            logger.error("Error writing load command: %s", e)
             return False
 
     def clear_load_command(self):
         """Clear the load command file"""
         try:
-            with open(LOAD_FILE, 'w') as f:
-                f.write("")
+            if self.load_fd is None:
+                return False
+            os.ftruncate(self.load_fd, 0)
             self.pending_load_command = None
             return True
         except Exception as e:
-            print(f"Error clearing load command: {e}")
+            logger.error("Error clearing load command: %s", e)
             return False
 
     def check_load_command(self):
         """Check if there's a pending load command to execute"""
         try:
-            if os.path.exists(LOAD_FILE):
-                with open(LOAD_FILE, 'r') as f:
-                    lines = f.read().strip().split('\n')
+            if self.load_fd is not None:
+                # Only read the file back when something has written to it
+                st = os.fstat(self.load_fd)
+                if (st.st_mtime_ns, st.st_size) == self.load_seen:
+                    return None
+                self.load_seen = (st.st_mtime_ns, st.st_size)
+                lines = os.pread(self.load_fd, st.st_size, 0).decode().strip().split('\n')
                 
                 if len(lines) >= 2 and lines[1] == "TRIGGER":
                     command = lines[0].strip()
-                    print(f"Load trigger detected for command: {command}")
+                    logger.debug("Load trigger detected for command: %s", command)
                     # Clear the trigger but keep the command
-                    with open(LOAD_FILE, 'w') as f:
-                        f.write(command)
+                    write_shared_file(self.load_fd, command)
+                    st = os.fstat(self.load_fd)
+                    self.load_seen = (st.st_mtime_ns, st.st_size)
                     return command
             return None
         except Exception as e:
-            print(f"Error checking load command: {e}")
+            logger.error("Error checking load command: %s", e)
             return None
 
+    def close_shared_files(self):
+        """Close the open shared RAM file descriptors"""
+        for fd in (self.shared_fd, self.load_fd):
+            if fd is not None:
+                os.close(fd)
+        self.shared_fd = self.load_fd = None
+        self.load_seen = None
+
     def delete_shared_files(self):
         """Delete the shared RAM files on exit"""
         try:
+            self.close_shared_files()
             if os.path.exists(SHARED_FILE):
                 os.remove(SHARED_FILE)
-                print(f"Deleted shared display file: {SHARED_FILE}")
+                logger.debug("Deleted shared display file: %s", SHARED_FILE)
             if os.path.exists(LOAD_FILE):
                 os.remove(LOAD_FILE)
-                print(f"Deleted shared load file: {LOAD_FILE}")
+                logger.debug("Deleted shared load file: %s", LOAD_FILE)
             return True
         except Exception as e:
-            print(f"Error deleting shared files: {e}")
+            logger.error("Error deleting shared files: %s", e)
             return False
 
     def launch_tag_manager(self, tag_id):
         """Launch the tag manager GUI for configuring a new tag"""
-        if not self.config["settings"].get("auto_launch_manager", True):
+        if not self.auto_launch_manager:
             return False
             
-        manager_script = os.path.join(SCRIPT_DIR, "rfidisk-manager.py")
-        if os.path.exists(manager_script):
+        if os.path.exists(MANAGER_SCRIPT):
             try:
-                subprocess.Popen([sys.executable, manager_script, "--edit", tag_id])
-                print(f"Launched tag manager for tag: {tag_id}")
+                subprocess.Popen([sys.executable, MANAGER_SCRIPT, "--edit", tag_id])
+                logger.info("Launched tag manager for tag: %s", tag_id)
                 return True
             except Exception as e:
-                print(f"Failed to launch tag manager: {e}")
+                logger.error("Failed to launch tag manager: %s", e)
         else:
-            print(f"Tag manager not found at: {manager_script}")
+            logger.error("Tag manager not found at: %s", MANAGER_SCRIPT)
         return False
 
     def create_or_update_new_entry(self, tag_id):
         """Create or update a new entry for unknown tags"""
-        new_entry_id = None
-        
-        # Check if there's already a "new entry"
-        for existing_id, entry in self.tags.items():
-            if entry.get("line1") == "new entry":
-                new_entry_id = existing_id
-                break
+        # Check if there's already a "new entry" (found when the tags were indexed)
+        new_entry_id = self._new_entry_id
         
         if new_entry_id:
             # Update existing new entry with new tag ID
             if new_entry_id != tag_id:
                 self.tags[tag_id] = self.tags[new_entry_id]
                 del self.tags[new_entry_id]
-                print(f"Updated new entry: {tag_id}")
+                self._tag_index.pop(new_entry_id.lower(), None)
+                self._icon_types.pop(new_entry_id.lower(), None)
+                logger.info("Updated new entry: %s", tag_id)
         else:
             # Create new entry with terminate field
             self.tags[tag_id] = {
@@ -285,7 +454,13 @@ class RFIDLauncher:
                 "line4": tag_id,
                 "terminate": ""
             }
-            print(f"New entry: {tag_id}")
+            logger.info("New entry: %s", tag_id)
+        
+        # Keep the lookups in step without rescanning every tag
+        entry = self.tags[tag_id]
+        self._new_entry_id = tag_id
+        self._tag_index[tag_id] = entry
+        self._icon_types[tag_id] = self.get_icon_type(entry.get("command", ""))
         
         # Save the updated tags
         self.save_tags()
@@ -298,62 +473,49 @@ class RFIDLauncher:
             if self.serial_conn and self.serial_conn.is_open:
                 self.serial_conn.close()
             
-            print(f"Connecting to {port}...")
-            self.serial_conn = serial.Serial(port, 9600, timeout=0.1)
-            time.sleep(2.5)
-            
-            # Clear any boot messages
-            if self.serial_conn.in_waiting > 0:
-                self.serial_conn.read(self.serial_conn.in_waiting)
+            logger.info("Connecting to %s...", port)
+            self.serial_conn = serial.Serial(port, 9600, timeout=SERIAL_READ_TIMEOUT)
+            self._rx_accum.clear()
+            self.last_display_frame = None  # The Arduino starts with a blank screen
             
-            # Wait for Arduino ready
-            start_time = time.time()
-            while time.time() - start_time < 3:
-                if self.serial_conn.in_waiting > 0:
-                    line = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
-                    if "OK" in line:
-                        print("Arduino ready!")
-                        self.serial_error_count = 0
-                        
-                        # Create shared files when Arduino is ready
-                        self.create_shared_files()
-
-                        # Push OLED idle timers (re-applied on every reconnect)
-                        self.send_oled_config()
-
-                        # STATE RECOVERY: Restore previous state after reconnection
-                        if self.reconnecting:
-                            time.sleep(0.5)
-                            self.recover_after_disconnection()
-                            self.reconnecting = False
-                            
-                        return True
-            
-            print("Connected (no OK message)")
+            # Wait for Arduino ready, returning as soon as its "OK" arrives.
+            # Boot noise before it is skipped line by line; anything after it
+            # (e.g. an ON: for a disk already inserted) stays buffered for run()
+            line = bytearray()
+            deadline = time.monotonic() + ARDUINO_READY_TIMEOUT
+            while time.monotonic() < deadline:
+                line += self.serial_conn.readline()
+                if not line.endswith(b'\n'):
+                    continue  # Timed out mid-line; keep what we have
+                if b"OK" in line:
+                    logger.info("Arduino ready!")
+                    break
+                line.clear()
+            else:
+                logger.warning("Connected (no OK message)")
             self.serial_error_count = 0
             
-            # Create shared files even without OK message
+            # Create shared files when Arduino is ready (or even without OK message)
             self.create_shared_files()
 
             # Push OLED idle timers (re-applied on every reconnect)
             self.send_oled_config()
 
-            # STATE RECOVERY: Still restore state even without OK message
+            # STATE RECOVERY: Restore previous state after reconnection
             if self.reconnecting:
-                time.sleep(0.5)
                 self.recover_after_disconnection()
                 self.reconnecting = False
                 
             return True
             
         except Exception as e:
-            print(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             self.serial_conn = None
             return False
 
     def recover_after_disconnection(self):
         """Recover state after serial disconnection - SILENT RECOVERY"""
-        print("Silent recovery after disconnection...")
+        logger.info("Silent recovery after disconnection...")
         
         # Enable recovery mode to suppress notifications
         self.recovery_mode = True
@@ -361,15 +523,15 @@ class RFIDLauncher:
         # Check if we had an active tag and we launched the app
         if self.active_tag and self.app_was_launched_by_us:
             tag_id = self.active_tag
-            print(f"Recovering active tag: {tag_id} (app was launched by us)")
+            logger.info("Recovering active tag: %s (app was launched by us)", tag_id)
             
             # Reload config and tags to get any changes
-            self.config, self.tags = load_config()
+            self.maybe_reload_config()
             
-            tag_config = self.tags.get(tag_id)
+            tag_config = self._tag_index.get(tag_id)
             if tag_config:
-                # Determine icon type based on command
-                icon_type = self.get_icon_type(tag_config.get("command", ""))
+                # Icon type was worked out from the command when the tags were loaded
+                icon_type = self._icon_types[tag_id]
                 # Update the display silently, no notifications, no relaunch
                 self.send_display_command(
                     tag_config.get("line1", "App"), 
@@ -378,7 +540,7 @@ class RFIDLauncher:
                     tag_config.get("line4", ""),
                     icon_type  
                 )
-                print(f"Silently restored display for {tag_id}")
+                logger.info("Silently restored display for %s", tag_id)
             else:
                 # Unknown tag - show error
                 self.send_display_command(
@@ -393,7 +555,7 @@ class RFIDLauncher:
             self.active_tag = None
             self.app_was_launched_by_us = False
             self.send_display_command("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}", "0")
-            print("Restored ready state")
+            logger.info("Restored ready state")
         
         # Disable recovery mode after recovery is complete
         self.recovery_mode = False
@@ -408,65 +570,66 @@ class RFIDLauncher:
             return "0"  # No icon
 
     def reconnect_serial(self):
-        """Attempt to reconnect to serial port"""
-        print("Attempting to reconnect...")
-        self.serial_error_count += 1
-        self.reconnecting = True
-        
-        if self.serial_error_count > self.max_serial_errors:
-            print("Too many serial errors, giving up...")
-            return False
+        """Attempt to reconnect to serial port.
+
+        The first call after a failure closes the port and schedules the
+        attempt RECONNECT_DELAY later; calls before then return False, so
+        the main loop keeps running instead of sleeping here."""
+        if self.reconnect_at is None:
+            logger.warning("Attempting to reconnect...")
+            self.serial_error_count += 1
+            self.reconnecting = True
             
-        # Close existing connection
-        if self.serial_conn and self.serial_conn.is_open:
-            try:
-                self.serial_conn.close()
-            except:
-                pass
+            if self.serial_error_count > self.max_serial_errors:
+                logger.warning("Too many serial errors, giving up...")
+                return False
+            
+            # Close existing connection
+            if self.serial_conn and self.serial_conn.is_open:
+                try:
+                    self.serial_conn.close()
+                except:
+                    pass
             self.serial_conn = None
+            
+            # Give the device time to come back before reconnecting
+            self.reconnect_at = time.monotonic() + RECONNECT_DELAY
+            return False
         
-        # Wait before reconnecting
-        time.sleep(2)
+        if time.monotonic() < self.reconnect_at:
+            return False
+        self.reconnect_at = None
         return self.connect_serial()
 
     def send_display_command(self, line1, line2, line3="", line4="", icon_type="0"):
         """Send display command with error handling and state tracking"""
+        frame = (line1, line2, line3, line4, icon_type)
+        if (frame == self.last_display_frame and
+                self.serial_conn and self.serial_conn.is_open):
+            return True  # Already on screen and in the shared file
+        
         # Store the current display state
-        self.last_display_state = (line1, line2, line3, line4)
+        self.last_display_state = frame[:4]
         
         # Update the shared RAM file with the current display info
         self.update_shared_file(line1, line2, line3, line4)
         
-        # Truncate strings
-        line1_trunc = line1[:20]
-        line2_trunc = line2[:20]
-        line3_trunc = line3[:14]
-        line4_trunc = line4[:14]
-        
         if not self.serial_conn or not self.serial_conn.is_open:
             if not self.reconnect_serial():
                 return False
             
         try:
-            # Escape any pipes in the strings
-            line1_esc = line1_trunc.replace('|', '_')
-            line2_esc = line2_trunc.replace('|', '_')
-            line3_esc = line3_trunc.replace('|', '_')
-            line4_esc = line4_trunc.replace('|', '_')
-            
-            # Updated command: D|line1|line2|line3|line4|iconType
-            command = f"D|{line1_esc}|{line2_esc}|{line3_esc}|{line4_esc}|{icon_type}\n"
-            self.serial_conn.write(command.encode())
-            self.serial_conn.flush()
+            self.serial_conn.write(display_command(*frame))
+            self.last_display_frame = frame
             return True
             
         except (serial.SerialException, OSError) as e:
-            print(f"Serial write error: {e}")
+            logger.error("Serial write error: %s", e)
             if not self.reconnect_serial():
                 return False
             return False
         except Exception as e:
-            print(f"Display error: {e}")
+            logger.error("Display error: %s", e)
             return False
 
     def send_oled_config(self):
@@ -481,10 +644,9 @@ class RFIDLauncher:
             off_s = int(self.config["settings"].get("oled_off_delay", 0))
             command = f"C|{dim_s}|{off_s}\n"
             self.serial_conn.write(command.encode())
-            self.serial_conn.flush()
             return True
         except Exception as e:
-            print(f"OLED config send error: {e}")
+            logger.error("OLED config send error: %s", e)
             return False
 
     def send_desktop_notification(self, title, message):
@@ -493,29 +655,22 @@ class RFIDLauncher:
         if self.recovery_mode or self.reconnecting:
             return False
             
-        if not self.config["settings"].get("desktop_notifications", True):
+        if not self.notifications_enabled:
             return False
             
-        try:
-            # Use the script directory to find the icon
-            icon_path = os.path.join(SCRIPT_DIR, "floppy.png")
-            
-            # Check if notify-send is available
-            result = subprocess.run(['which', 'notify-send'], capture_output=True)
-            if result.returncode != 0:
-                return False
+        # Check if notify-send is available
+        if not self.notify_send:
+            return False
             
-            # Get notification timeout from config, default to 8000ms
-            notification_timeout = str(self.config["settings"].get("notification_timeout", 8000))
-                
-            # Send the notification
-            subprocess.run([
-                'notify-send',
-                '-i', icon_path,
+        try:
+            # Send the notification without waiting for notify-send to exit
+            subprocess.Popen([
+                self.notify_send,
+                '-i', NOTIFY_ICON,
                 title,
                 message,
-                '-t', notification_timeout
-            ])
+                '-t', self.notification_timeout
+            ], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
             
         except Exception as e:
@@ -530,28 +685,23 @@ class RFIDLauncher:
     def launch_application(self, app_command, tag_line1, tag_line2):
         # Don't launch if we already launched this app
         if self.app_was_launched_by_us and self.active_tag:
-            print(f"App already launched by us for tag: {self.active_tag}")
+            logger.debug("App already launched by us for tag: %s", self.active_tag)
             return self.active_process
             
         try:
             # Send desktop notification (only on first launch)
             self.send_desktop_notification("RFIDisk Inserted", f"{tag_line1}\n{tag_line2}")
             
-            process = subprocess.Popen(
-                app_command, 
-                shell=True,
-                preexec_fn=os.setsid
-            )
+            process = spawn_command(app_command)
             
             self.active_process = process
             self.app_was_launched_by_us = True  # Mark that we launched this app
-            time.sleep(1.0)
 
-            print(f"Launched: {process.pid}")
+            logger.info("Launched: %s", process.pid)
             
             return process
         except Exception as e:
-            print(f"Launch error: {e}")
+            logger.error("Launch error: %s", e)
             self.send_desktop_notification("Error", f"Failed: {tag_line1}")
             return None
 
@@ -561,18 +711,12 @@ class RFIDLauncher:
         
         if terminate_command:
             # Use custom terminate command
-            print(f"Using custom terminate command: {terminate_command}")
+            logger.info("Using custom terminate command: %s", terminate_command)
             try:
-                process = subprocess.Popen(
-                    terminate_command,
-                    shell=True,
-                    preexec_fn=os.setsid
-                )
-                # Wait a bit for the terminate command to take effect
-                time.sleep(2)
-                print("Custom terminate command executed")
+                process = spawn_command(terminate_command)
+                logger.debug("Custom terminate command executed")
             except Exception as e:
-                print(f"Custom terminate command failed: {e}")
+                logger.error("Custom terminate command failed: %s", e)
                 # Fall back to standard method if custom command fails
                 self.terminate_standard()
             finally:
@@ -589,31 +733,58 @@ class RFIDLauncher:
         if not self.active_process:
             return
             
-        print(f"Standard termination: {self.active_process.pid}")
+        logger.debug("Standard termination: %s", self.active_process.pid)
         
         try:
             try:
-                os.killpg(os.getpgid(self.active_process.pid), signal.SIGTERM)
-                time.sleep(2)
-                if self.active_process.poll() is None:
-                    os.killpg(os.getpgid(self.active_process.pid), signal.SIGKILL)
+                process = self.active_process
+                pgid = os.getpgid(process.pid)
+                os.killpg(pgid, signal.SIGTERM)
+                # Escalate to SIGKILL from the main loop instead of sleeping
+                # here, so serial events keep being handled meanwhile
+                if process.poll() is None:
+                    self.finish_pending_kill(force=True)
+                    self.pending_kill = (process, pgid, time.monotonic() + TERMINATE_GRACE)
             except ProcessLookupError:
                 pass
                     
         except Exception as e:
-            print(f"Standard termination error: {e}")
+            logger.error("Standard termination error: %s", e)
         finally:
             self.active_process = None
             # NEW: Reset launch tracking when process is terminated
             self.app_was_launched_by_us = False
 
+    def finish_pending_kill(self, force=False, wait=False):
+        """SIGKILL a terminated app that outlived its grace period.
+
+        Called from the main loop; force kills right away and wait sleeps out
+        the rest of the grace period first (used on shutdown)."""
+        if not self.pending_kill:
+            return
+        process, pgid, deadline = self.pending_kill
+        if wait:
+            while process.poll() is None and time.monotonic() < deadline:
+                time.sleep(0.1)
+        elif not force and time.monotonic() < deadline:
+            if process.poll() is None:
+                return
+        self.pending_kill = None
+        if process.poll() is None:
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            except Exception as e:
+                logger.error("Standard termination error: %s", e)
+
     def close_current_app(self):
         """Close current app using appropriate termination method"""
         if not self.active_tag:
             return
             
         # Get the tag config to check for custom terminate command
-        tag_config = self.tags.get(self.active_tag, {})
+        tag_config = self._tag_index.get(self.active_tag, {})
         self.terminate_application(tag_config)
         
         # Reset launch tracking
@@ -622,55 +793,56 @@ class RFIDLauncher:
     def process_serial_data(self, data):
         # Ignore RFID events during reconnection to prevent double-launching
         if self.reconnecting:
-            print(f"Ignoring RFID during reconnect: {data}")
+            logger.debug("Ignoring RFID during reconnect: %s", data)
             return
             
-        print(f"RFID: {data}")
+        logger.debug("RFID: %s", data)
         
-        if data.startswith("ON:"):
-            tag_id = data[3:].strip().lower()
-            print(f"Tag: {tag_id}")
-            
-            # Don't process the same tag if app is already running and was launched by us
-            if (self.active_tag == tag_id and 
-                self.app_was_launched_by_us and
-                self.is_process_running()):  # NEW: Also check if process is actually running
-                print(f"Tag {tag_id} already active with app launched by us, ignoring")
-                return
-                
-            # Reload config and tags to get any changes
-            self.config, self.tags = load_config()
+        handler = self.event_handlers.get(data[:3])
+        if handler:
+            handler(data[3:].strip().lower())
 
-            # Re-apply OLED idle timers in case they changed in the manager
+    def on_tag_inserted(self, tag_id):
+        """Handle an ON: event for a disk placed on the reader"""
+        logger.debug("Tag: %s", tag_id)
+        
+        if self.pending_removal:
+            if self.pending_removal[0] == tag_id:
+                # Reinserted within the removal delay - the removal never happened
+                logger.debug("Tag %s reinserted, cancelling removal", tag_id)
+                self.pending_removal = None
+            else:
+                self.finish_removal()
+        
+        # Don't process the same tag if app is already running and was launched by us
+        if (self.active_tag == tag_id and 
+            self.app_was_launched_by_us and
+            self.is_process_running()):  # NEW: Also check if process is actually running
+            logger.debug("Tag %s already active with app launched by us, ignoring", tag_id)
+            return
+            
+        # Reload config and tags to get any changes, re-applying the OLED
+        # idle timers in case they changed in the manager
+        if self.maybe_reload_config():
             self.send_oled_config()
 
-            tag_config = self.tags.get(tag_id)
-            if tag_config:
-                # Only close current app if it's a different tag
-                if self.active_process and self.active_tag != tag_id:
-                    print("Closing previous app...")
-                    self.close_current_app()
-                    time.sleep(0.5)
-                
-                self.active_tag = tag_id
-                
-                # Determine icon type based on command
-                icon_type = self.get_icon_type(tag_config.get("command", ""))
-                
-                # Update display with appropriate icon
-                self.send_display_command(
-                    tag_config.get("line1", "App"), 
-                    tag_config.get("line2", ""),
-                    tag_config.get("line3", ""),
-                    tag_config.get("line4", ""),
-                    icon_type
-                )
-                
-                # Check if command is empty and launch manager if needed
-                command = tag_config.get("command", "").strip()
-                if not command:
-                    # Empty command detected - launch manager for configuration
-                    print(f"Empty command detected for tag {tag_id}, launching manager")
+        tag_config = self._tag_index.get(tag_id)
+        if tag_config:
+            # Only close current app if it's a different tag
+            if self.active_process and self.active_tag != tag_id:
+                logger.info("Closing previous app...")
+                self.close_current_app()
+            
+            self.active_tag = tag_id
+            
+            # Check if command is empty and launch manager if needed. The
+            # screen is only drawn once we know which one sticks, so the
+            # OLED doesn't flash through frames nobody gets to read
+            command = tag_config.get("command", "").strip()
+            if not command:
+                # Empty command detected - launch manager for configuration
+                logger.info("Empty command detected for tag %s, launching manager", tag_id)
+                if self.launch_tag_manager(tag_id):
                     self.send_display_command(
                         "Please configure",
                         "Tag (executable",
@@ -678,49 +850,60 @@ class RFIDLauncher:
                         tag_id,
                         "0"
                     )
-                    
-                    if self.launch_tag_manager(tag_id):
-                        self.send_desktop_notification(
-                            "Configuration Required", 
-                            f"Please configure tag {tag_id}\n(executable not found)"
-                        )
-                        print(f"Launched tag manager for unconfigured tag: {tag_id}")
-                    else:
-                        self.send_display_command(
-                            "Config Error",
-                            "Manager not found",
-                            "Edit manually:",
-                            tag_id,
-                            "0"
-                        )
-                
-                # Handle autolaunch logic with load command file
-                elif command and not self.app_was_launched_by_us:
-                    if self.config["settings"].get("disable_autolaunch", False):
-                        # Autolaunch disabled - write command to load file
-                        print(f"Autolaunch disabled - writing command to load file")
-                        self.write_load_command(command)
-                        self.send_desktop_notification(
-                            "RFIDisk Ready", 
-                            f"{tag_config.get('line1', 'App')} ready\nUse 'rfidisk.py --load' to launch"
-                        )
-                    else:
-                        # Autolaunch enabled - launch directly
-                        print(f"Launch: {tag_config['command']}")
-                        self.launch_application(
-                            tag_config['command'], 
-                            tag_config.get("line1", "App"),
-                            tag_config.get("line2", "")
-                        )
-                elif self.app_was_launched_by_us:
-                    print("App already launched by us, not relaunching")
-                    
+                    self.send_desktop_notification(
+                        "Configuration Required", 
+                        f"Please configure tag {tag_id}\n(executable not found)"
+                    )
+                    logger.info("Launched tag manager for unconfigured tag: %s", tag_id)
+                else:
+                    self.send_display_command(
+                        "Config Error",
+                        "Manager not found",
+                        "Edit manually:",
+                        tag_id,
+                        "0"
+                    )
+                return
+            
+            # Update display with appropriate icon (worked out from the
+            # command when the tags were loaded)
+            self.send_display_command(
+                tag_config.get("line1", "App"), 
+                tag_config.get("line2", ""),
+                tag_config.get("line3", ""),
+                tag_config.get("line4", ""),
+                self._icon_types[tag_id]
+            )
+            
+            # Handle autolaunch logic with load command file
+            if not self.app_was_launched_by_us:
+                if self.autolaunch_disabled:
+                    # Autolaunch disabled - write command to load file
+                    logger.info("Autolaunch disabled - writing command to load file")
+                    self.write_load_command(command)
+                    self.send_desktop_notification(
+                        "RFIDisk Ready", 
+                        f"{tag_config.get('line1', 'App')} ready\nUse 'rfidisk.py --load' to launch"
+                    )
+                else:
+                    # Autolaunch enabled - launch directly
+                    logger.info("Launch: %s", tag_config['command'])
+                    self.launch_application(
+                        tag_config['command'], 
+                        tag_config.get("line1", "App"),
+                        tag_config.get("line2", "")
+                    )
             else:
-                # Unknown tag - create/update new entry
-                self.active_tag = tag_id
-                self.last_unknown_tag = tag_id
-                new_tag_id = self.create_or_update_new_entry(tag_id)
+                logger.debug("App already launched by us, not relaunching")
                 
+        else:
+            # Unknown tag - create/update new entry
+            self.active_tag = tag_id
+            self.last_unknown_tag = tag_id
+            new_tag_id = self.create_or_update_new_entry(tag_id)
+            
+            # Auto-launch tag manager for configuration
+            if self.launch_tag_manager(new_tag_id):
                 # Show new entry screen
                 self.send_display_command(
                     "new tag detected",
@@ -729,172 +912,302 @@ class RFIDLauncher:
                     new_tag_id,
                     "0"
                 )
-                
-                # Auto-launch tag manager for configuration
-                if self.launch_tag_manager(new_tag_id):
-                    self.send_desktop_notification("New Tag", f"Configuring tag {new_tag_id}")
-                    print(f"Auto-launched tag manager for new tag: {new_tag_id}")
-                else:
-                    # Fallback if manager can't be launched
-                    self.send_display_command(
-                        "new entry",
-                        "configure me",
-                        "edit rfidisk_tags.json",
-                        new_tag_id,
-                        "0"
-                    )
-                    self.send_desktop_notification("New Tag", f"Tag {new_tag_id} added - configure manually")
-                
-                print(f"New tag: {tag_id}")
-                
-        elif data.startswith("OF:"):
-            tag_id = data[3:].strip().lower()
-            print(f"Remove: {tag_id}")
+                self.send_desktop_notification("New Tag", f"Configuring tag {new_tag_id}")
+                logger.info("Auto-launched tag manager for new tag: %s", new_tag_id)
+            else:
+                # Fallback if manager can't be launched
+                self.send_display_command(
+                    "new entry",
+                    "configure me",
+                    "edit rfidisk_tags.json",
+                    new_tag_id,
+                    "0"
+                )
+                self.send_desktop_notification("New Tag", f"Tag {new_tag_id} added - configure manually")
             
-            if tag_id == self.active_tag:
-                removal_delay = self.config["settings"].get("removal_delay", 0.0)
-                print(f"Wait {removal_delay}s...")
-                time.sleep(removal_delay)
-                if self.active_tag == tag_id:
-                    self.close_current_app()
-                    self.active_tag = None
-                    self.clear_load_command()  # Clear load command on disk removal
-                    self.send_display_command("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}", "0")
-                    print("App closed")
+            logger.info("New tag: %s", tag_id)
+
+    def on_tag_removed(self, tag_id):
+        """Handle an OF: event for a disk taken off the reader"""
+        logger.debug("Remove: %s", tag_id)
+        
+        if tag_id == self.active_tag:
+            # Closing is deferred by the removal delay (checked from run()), so
+            # reinserting the disk in time can still cancel it
+            logger.debug("Wait %ss...", self.removal_delay)
+            self.pending_removal = (tag_id, time.monotonic() + self.removal_delay)
+            if self.removal_delay <= 0:
+                self.finish_removal()
+
+    def finish_removal(self):
+        """Close the app for a removed disk once its removal delay has passed"""
+        tag_id, _ = self.pending_removal
+        self.pending_removal = None
+        if self.active_tag == tag_id:
+            self.close_current_app()
+            self.active_tag = None
+            self.clear_load_command()  # Clear load command on disk removal
+            self.send_display_command("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}", "0")
+            logger.info("App closed")
 
     def read_serial(self):
-        """Read from serial with robust error handling"""
+        """Read everything waiting on serial and return the complete lines in it"""
         if not self.serial_conn or not self.serial_conn.is_open:
             if not self.reconnect_serial():
-                return None
+                # Nothing to block on; don't let the main loop spin
+                time.sleep(SERIAL_READ_TIMEOUT)
+                return []
         
         try:
-            if self.serial_conn.in_waiting > 0:
-                data = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
-                if data:
-                    self.serial_error_count = 0  # Reset counter on successful read
-                    return data
+            # Blocks for the first byte (up to the timeout), then takes the
+            # whole buffer so queued events are handled back-to-back
+            chunk = self.serial_conn.read(self.serial_conn.in_waiting or 1)
         except (serial.SerialException, OSError) as e:
-            print(f"Serial read error: {e}")
+            logger.error("Serial read error: %s", e)
             if not self.reconnect_serial():
-                return None
+                time.sleep(SERIAL_READ_TIMEOUT)
+            return []
         except Exception as e:
-            print(f"Unexpected serial error: {e}")
-            
-        return None
+            logger.error("Unexpected serial error: %s", e)
+            time.sleep(SERIAL_READ_TIMEOUT)
+            return []
+        
+        if not chunk:
+            return []
+        self._rx_accum += chunk
+        if b'\n' not in chunk:
+            return []
+        
+        *complete, partial = self._rx_accum.split(b'\n')
+        self._rx_accum = partial  # Keep the unfinished line for the next read
+        lines = []
+        for raw in complete:
+            data = raw.decode('utf-8', errors='ignore').strip()
+            if data:
+                lines.append(data)
+        if lines:
+            self.serial_error_count = 0  # Reset counter on successful read
+        return lines
+
+    def maybe_reload_config(self):
+        """Reload config and tags only if either file changed on disk; return True if reloaded"""
+        signature = config_signature()
+        if signature == self._config_signature:
+            return False
+        self.config, self.tags = load_config()
+        # load_config may have recreated a missing file, so stat again
+        self._config_signature = config_signature()
+        self._apply_settings()
+        self._index_tags()
+        return True
+
+    def _apply_settings(self):
+        """Copy the settings read on tag events into attributes, once per config load"""
+        settings = self.config["settings"]
+        self.removal_delay = settings.get("removal_delay", 0.0)
+        self.autolaunch_disabled = settings.get("disable_autolaunch", False)
+        self.auto_launch_manager = settings.get("auto_launch_manager", True)
+        self.notifications_enabled = settings.get("desktop_notifications", True)
+        # Get notification timeout from config, default to 8000ms
+        self.notification_timeout = str(settings.get("notification_timeout", 8000))
+
+    def _index_tags(self):
+        """Rebuild the lowercased tag_id -> tag config and icon type lookups used on tag events"""
+        self._tag_index = {tag_id.lower(): tag_config for tag_id, tag_config in self.tags.items()}
+        self._new_entry_id = next((tag_id for tag_id, tag_config in self.tags.items()
+                                   if tag_config.get("line1") == "new entry"), None)
+        # Kept apart from the tag configs so it never ends up in rfidisk_tags.json
+        self._icon_types = {tag_id: self.get_icon_type(tag_config.get("command", ""))
+                            for tag_id, tag_config in self._tag_index.items()}
 
     def save_tags(self):
-        """Save tags to file"""
-        return save_tags(self.tags)
+        """Save tags to file, skipping the write if nothing changed since our last one"""
+        payload = json_dumps(self.tags)
+        # Only skip if the file is still the one we wrote (not edited meanwhile)
+        if payload == self._saved_tags and config_signature() == self._config_signature:
+            return True
+        try:
+            atomic_write_bytes(TAGS_FILE, payload)
+        except Exception as e:
+            logger.error("Error saving tags: %s", e)
+            return False
+        self._saved_tags = payload
+        # Our own write shouldn't trigger a reload on the next event
+        self._config_signature = config_signature()
+        return True
 
     def run(self):
-        print(f"Starting RFIDisk v.{VERSION}...")
+        logger.info("Starting RFIDisk v.%s...", VERSION)
         
         # Check if autolaunch is disabled
-        if self.config["settings"].get("disable_autolaunch", False):
-            print("AUTOLAUNCH DISABLED - Inserting disks will not auto-launch apps")
-            print("Use 'python3 rfidisk.py --load' to launch the current app")
-        
-        if not self.connect_serial():
-            return
-        
-        print("Ready")
+        if self.autolaunch_disabled:
+            logger.warning("AUTOLAUNCH DISABLED - Inserting disks will not auto-launch apps")
+            logger.warning("Use 'python3 rfidisk.py --load' to launch the current app")
         
-        # Send initial display with icon_type=0 (no icon)
-        self.send_display_command("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}", "0")
+        # `kill`/systemd stop the daemon like Ctrl+C, so shutdown() still runs
+        signal.signal(signal.SIGTERM, self._on_sigterm)
+        self.reload_socket = self.open_reload_socket()
         
         try:
-            load_check_counter = 0
-            process_check_counter = 0
+            if not self.connect_serial():
+                return
+            
+            logger.info("Ready")
+            
+            # Send initial display with icon_type=0 (no icon)
+            self.send_display_command("Ready", "Insert Disk", "", f"RFIDisk v{VERSION}", "0")
+            
+            next_load_check = next_process_check = time.monotonic()
             while self.running:
-                # Check for serial data
-                data = self.read_serial()
-                if data:
+                # Wait for serial data (returns early as soon as a line arrives)
+                for data in self.read_serial():
                     self.process_serial_data(data)
+                self.finish_pending_kill()
+                now = time.monotonic()
+                
+                if self.pending_removal and now >= self.pending_removal[1]:
+                    self.finish_removal()
+                
+                # The manager saved its settings; apply them (e.g. OLED timers) now
+                if self.take_reload_request():
+                    if self.maybe_reload_config():
+                        self.send_oled_config()
                 
                 # NEW: Check if process is still running (every 2 seconds)
-                process_check_counter += 1
-                if process_check_counter >= 20:  # 20 * 0.1s = 2 seconds
-                    process_check_counter = 0
+                if now >= next_process_check:
+                    next_process_check = now + PROCESS_CHECK_INTERVAL
                     if (self.app_was_launched_by_us and 
                         self.active_process and 
                         not self.is_process_running()):
-                        print("Process is no longer running - resetting launch tracking")
+                        logger.info("Process is no longer running - resetting launch tracking")
                         self.app_was_launched_by_us = False
                         self.active_process = None
                 
                 # Check for load commands every 1 second (instead of every loop)
-                load_check_counter += 1
-                if load_check_counter >= 10:  # 10 * 0.1s = 1 second
-                    load_check_counter = 0
+                if now >= next_load_check:
+                    next_load_check = now + LOAD_CHECK_INTERVAL
                     load_command = self.check_load_command()
                     if load_command and self.active_tag and not self.app_was_launched_by_us:
-                        print(f"Executing load command: {load_command}")
-                        tag_config = self.tags.get(self.active_tag, {})
+                        logger.info("Executing load command: %s", load_command)
+                        tag_config = self._tag_index.get(self.active_tag, {})
                         success = self.launch_application(
                             load_command,
                             tag_config.get("line1", "App"),
                             tag_config.get("line2", "")
                         )
                         if success:
-                            print("App launched successfully via load command")
+                            logger.info("App launched successfully via load command")
                         else:
-                            print("Failed to launch app via load command")
-                
-                time.sleep(0.1)
+                            logger.error("Failed to launch app via load command")
                 
         except KeyboardInterrupt:
-            print("\nShutting down...")
+            logger.info("Shutting down...")
             self.running = False
         finally:
             # Ensure shutdown is always called
             self.shutdown()
 
+    def _on_sigterm(self, signum, frame):
+        """Stop the main loop the way Ctrl+C does"""
+        # A second SIGTERM must not cut the cleanup in shutdown() short
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        raise KeyboardInterrupt
+
+    def open_reload_socket(self):
+        """Bind the socket the manager pings for a config reload, or return None"""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(RELOAD_ADDRESS)
+        except OSError as e:
+            logger.warning("Config reload requests unavailable: %s", e)
+            sock.close()
+            return None
+        sock.setblocking(False)
+        return sock
+
+    def take_reload_request(self):
+        """Drain pending reload pings, returning True if there were any"""
+        requested = False
+        while self.reload_socket is not None:
+            try:
+                self.reload_socket.recv(64)
+            except OSError:  # BlockingIOError: nothing (more) queued
+                break
+            requested = True
+        return requested
+
     def shutdown(self):
         self.running = False
+        # Don't leave a just-closed app behind if it ignores SIGTERM
+        self.finish_pending_kill(wait=True)
         if self.serial_conn and self.serial_conn.is_open:
             try:
                 self.serial_conn.close()
-            except:
+            except OSError:  # SerialException is an OSError too
                 pass
+        if self.reload_socket is not None:
+            self.reload_socket.close()
+            self.reload_socket = None
         # Delete the shared RAM files on shutdown
         self.delete_shared_files()
-        print(f"RFIDisk v.{VERSION} stopped")
+        logger.info("RFIDisk v.%s stopped", VERSION)
+
+def read_shared_file(path):
+    """Return the text of a shared RAM file, or None if the daemon hasn't created it"""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 def handle_load_command():
     """Handle the --load command by writing the trigger"""
     try:
-        if not os.path.exists(LOAD_FILE):
-            print("No app ready to load - insert a disk first")
-            return False
-        
-        with open(LOAD_FILE, 'r') as f:
+        # Read and rewrite through one handle; a missing file means no daemon/disk
+        with open(LOAD_FILE, 'r+') as f:
             current_content = f.read().strip()
-        
-        if current_content:
-            # Add trigger to existing command
-            with open(LOAD_FILE, 'w') as f:
+            
+            if current_content:
+                # Add trigger to existing command
+                f.seek(0)
                 f.write(f"{current_content}\nTRIGGER")
-            print("Load trigger activated - daemon should launch the app")
-            return True
-        else:
-            print("No app ready to load - insert a disk first")
-            return False
+                f.truncate()
+                print("Load trigger activated - daemon should launch the app")
+                return True
+        
+        print("No app ready to load - insert a disk first")
+        return False
             
+    except FileNotFoundError:
+        print("No app ready to load - insert a disk first")
+        return False
     except Exception as e:
         print(f"Error handling load command: {e}")
         return False
 
+def find_tag_by_title(line1, line2):
+    """Return (tag_id, tag_config) for the tag whose line1/line2 match, or ("", {})
+
+    Only parses the tags file: unlike load_config() this skips the settings
+    file and never creates default files, which matters since the manager
+    runs --list every second."""
+    with open(TAGS_FILE, 'rb') as f:
+        tags = json_load(f)
+    for tag_id, tag_config in tags.items():
+        if (tag_config.get('line1', '') == line1 and
+            tag_config.get('line2', '') == line2):
+            return tag_id, tag_config
+    return "", {}
+
 def handle_list_command():
     """Handle the --list command by displaying formatted info"""
     try:
-        if not os.path.exists(SHARED_FILE):
+        # Read display info
+        display_content = read_shared_file(SHARED_FILE)
+        if display_content is None:
             print("RFIDisk daemon not running or no disk inserted")
             return False
-        
-        # Read display info
-        with open(SHARED_FILE, 'r') as f:
-            display_content = f.read().strip()
+        display_content = display_content.strip()
 
         # Parse display lines
         parts = display_content.split('|')
@@ -911,28 +1224,19 @@ def handle_list_command():
         
         # Get launch command
         launch_command = ""
-        if os.path.exists(LOAD_FILE):
-            with open(LOAD_FILE, 'r') as f:
-                launch_content = f.read().strip()
-                # Remove TRIGGER line if present
-                if '\n' in launch_content:
-                    launch_command = launch_content.split('\n')[0]
-                else:
-                    launch_command = launch_content
+        launch_content = read_shared_file(LOAD_FILE)
+        if launch_content is not None:
+            # Remove TRIGGER line if present
+            launch_command = launch_content.strip().split('\n')[0]
         
         # Get terminate command and tag ID (if we can find the active tag)
         terminate_command = ""
         tag_id = ""
         try:
             # Try to find the active tag by matching line1 with tag configurations
-            config, tags = load_config()
-            for current_tag_id, tag_config in tags.items():
-                if (tag_config.get('line1', '') == line1 and 
-                    tag_config.get('line2', '') == line2):
-                    terminate_command = tag_config.get('terminate', '')
-                    tag_id = current_tag_id
-                    break
-        except:
+            tag_id, tag_config = find_tag_by_title(line1, line2)
+            terminate_command = tag_config.get('terminate', '')
+        except (OSError, ValueError, AttributeError):
             pass  # If we can't load tags, just leave terminate_command empty
         
         # Output formatted information
@@ -954,12 +1258,11 @@ def handle_list_command():
 def handle_list_title_command():
     """Handle the --list-title command by displaying only line1 and line2"""
     try:
-        if not os.path.exists(SHARED_FILE):
-            return False
-        
         # Read display info
-        with open(SHARED_FILE, 'r') as f:
-            display_content = f.read().strip()
+        display_content = read_shared_file(SHARED_FILE)
+        if display_content is None:
+            return False
+        display_content = display_content.strip()
         
         # Parse display lines
         parts = display_content.split('|')
@@ -975,27 +1278,56 @@ def handle_list_title_command():
     except Exception as e:
         return False
 
+RED = '\033[91m'
+RESET = '\033[0m'
+BOLD = '\033[1m'
+
+WARNING_MESSAGE = [
+    "",
+    "This software can automatically launch applications.",
+    "Make sure your configuration only contains",
+    "trusted commands to avoid potential security risks.            ",
+    ""
+]
+
+# The whole startup banner, built once
+WARNING_BANNER = "\n".join(
+    ["", f"{RED}{BOLD}WARNING! USE AT YOUR OWN RISK!!!{RESET}"]
+    + [f"{BOLD}{line}{RESET}" for line in WARNING_MESSAGE]
+)
+
 def print_warning():
     """Print warning message in red text"""
-    RED = '\033[91m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
-    
-    warning_message = [
-        "",
-        "This software can automatically launch applications.",
-        "Make sure your configuration only contains",
-        "trusted commands to avoid potential security risks.            ",
-        ""
-    ]
-    
-    print(f"")
-    print(f"{RED}{BOLD}WARNING! USE AT YOUR OWN RISK!!!{RESET}")
+    print(WARNING_BANNER)
 
-    for line in warning_message:
-        print(f"{BOLD}{line}{RESET}")
+# CLI modes that status bars and hotkeys call with no other arguments
+CLI_MODES = ('--load', '--list', '--list-title')
+
+
+def run_cli_mode(mode):
+    """Run one of the --load/--list/--list-title modes, exiting 1 on failure"""
+    if mode == '--load':
+        print("Load mode: Triggering app launch via daemon...")
+        if handle_load_command():
+            print("Load command sent successfully")
+        else:
+            print("Failed to trigger load command")
+            sys.exit(1)
+
+    elif mode == '--list':
+        if not handle_list_command():
+            print("No disk information available")
+            sys.exit(1)
+
+    elif mode == '--list-title':
+        if not handle_list_title_command():
+            sys.exit(1)
+
+
+def parse_args():
+    """Build the full argparse parser (only needed for --help, errors and daemon mode)"""
+    import argparse
 
-def main():
     # Parse command line arguments including --load, --list, and --list-title
     parser = argparse.ArgumentParser(
         description='💾 RFIDisk - Physical App Launcher\n\n'
@@ -1017,7 +1349,17 @@ Read https://github.com/ItsDanik/rfidisk/blob/main/README.md for more info.
     parser.add_argument('--list-title', action='store_true',
                        help='Display only the title of current disk (line1 & line2 of entry)')
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    # A bare --list-title from a status bar runs every second, so the plain
+    # one-flag calls skip building the argparse parser entirely
+    if len(sys.argv) == 2 and sys.argv[1] in CLI_MODES:
+        run_cli_mode(sys.argv[1])
+        return
+
+    args = parse_args()
     
     # Handle mutually exclusive arguments
     arg_count = sum([args.load, args.list, args.list_title])
@@ -1025,32 +1367,19 @@ Read https://github.com/ItsDanik/rfidisk/blob/main/README.md for more info.
         print("Error: --load, --list, and --list-title are mutually exclusive")
         sys.exit(1)
     
-    # Print warning message only for daemon mode
-    if not any([args.load, args.list, args.list_title]):
-        print_warning()
-    
-    # Handle --load mode
     if args.load:
-        print("Load mode: Triggering app launch via daemon...")
-        if handle_load_command():
-            print("Load command sent successfully")
-        else:
-            print("Failed to trigger load command")
-            sys.exit(1)
-    
-    # Handle --list mode
+        run_cli_mode('--load')
     elif args.list:
-        if not handle_list_command():
-            print("No disk information available")
-            sys.exit(1)
-    
-    # Handle --list-title mode
+        run_cli_mode('--list')
     elif args.list_title:
-        if not handle_list_title_command():
-            sys.exit(1)
-    
+        run_cli_mode('--list-title')
     else:
-        # Normal daemon mode
+        # Normal daemon mode. Status goes to stdout like before;
+        # RFIDISK_DEBUG=1 adds per-event tracing
+        debug = os.environ.get("RFIDISK_DEBUG") == "1"
+        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO,
+                            format="%(message)s", stream=sys.stdout)
+        print_warning()
         launcher = RFIDLauncher()
         try:
             launcher.run()